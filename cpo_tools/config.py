@@ -9,6 +9,10 @@
 from pathlib import Path
 import yaml
 
+from cpo_tools.src.parsers import yaml_loader
+
+_YamlLoader = yaml_loader()
+
 
 def load_config():
     """Load configuration from multiple sources with proper precedence."""
@@ -25,12 +29,12 @@ def load_config():
     user_config_path = Path.home() / ".cpo-tools" / "config.yaml"
     if user_config_path.exists():
         with open(user_config_path) as f:
-            config.update(yaml.safe_load(f))
+            config.update(yaml.load(f, Loader=_YamlLoader))
 
     # Project configuration from current directory
     project_config_path = Path.cwd() / ".cpo-tools.yaml"
     if project_config_path.exists():
         with open(project_config_path) as f:
-            config.update(yaml.safe_load(f))
+            config.update(yaml.load(f, Loader=_YamlLoader))
 
     return config
@@ -80,27 +80,84 @@ without re-specifying the JSON.
 """
 import sys
 import json
+import functools
 from pathlib import Path
-from jinja2 import Environment, PackageLoader
-
-try:
-    import yaml  # type: ignore
-except Exception:  # optional
-    yaml = None
+from collections.abc import Mapping
 
+# Jinja2, PyYAML and the rendering modules are imported where they are used,
+# so --help, --llm-help and trait-only runs do not pay for them.
 from cpo_tools.src.args import parse_args
-from cpo_tools.src.llm import show_llm_help
-from cpo_tools.src.process import process_input
-from cpo_tools.src.trait_impl import render_trait_impl
-from cpo_tools.src.shim_impl import render_adl_shim
 from cpo_tools.src.output import wrap_output, write_output
+from cpo_tools.src.parsers import json_loads as _json_loads, yaml_loader
+
+# Deletion table for the '$' and "'" markers used only while parsing specs
+_STRIP_PARSE_MARKERS = str.maketrans("", "", "$'")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_env():
+    """Return the shared template Environment (compiled templates stay cached on it).
+
+    The templates ship with the package, so auto_reload is off and cached
+    templates are returned without re-checking the loader for changes.
+    """
+    from jinja2 import Environment, PackageLoader
+
+    return Environment(
+        loader=PackageLoader("cpo_tools", "templates"),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+
+
+def _minimal_ctx(cpo_name):
+    """Context for flows that only need the CPO name (trait/shim emission)."""
+    return {"cpo_name": cpo_name, "has_generics": False, "arg_pairs": "", "arg_types": "", "llm_metadata": {}}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry_index(path, mtime_ns, size):
+    """Read a registry and map each entry's struct and tag name to the entry (first match wins).
+
+    Cached on (path, mtime, size) so batch callers parse an unchanged registry once.
+    """
+    reg = _json_loads(Path(path).read_bytes())
+    by_key = {}
+    for entry in reg or ():
+        for key in (entry.get("struct"), entry.get("name")):
+            if key:
+                by_key.setdefault(key, entry)
+    return by_key
+
 
+def _render_cpo_with_ctx(spec, doxygen=False):
+    """Render the CPO definition for a spec dict; return (code, template context).
 
-def main():
+    The code has its parse markers stripped; the context keeps them for the
+    stub, trait and shim emitters.
+    """
+    from cpo_tools.src.process import process_input
+
+    generated_code, ctx = process_input(spec, doxygen, _get_env())
+    return generated_code.translate(_STRIP_PARSE_MARKERS), ctx
+
+
+def render_cpo(spec, doxygen=False):
+    """Render the CPO definition for a spec dict and return it as a string.
+
+    This is what the CLI prints for a spec without any output options.
+    """
+    return _render_cpo_with_ctx(spec, doxygen)[0]
+
+
+def main(argv=None):
     """Main entry point for the CPO generator script."""
-    args,parser = parse_args()
+    args,parser = parse_args(argv)
 
     if args.llm_help:
+        from cpo_tools.src.llm import show_llm_help
+
         show_llm_help()
         return
 
@@ -118,17 +175,21 @@ def main():
             else:
                 fmt = "json"
         try:
-            text = path.read_text()
+            # Both parsers accept bytes directly; skip the str decode
+            data = path.read_bytes()
             if fmt == "json":
-                input_data = json.loads(text)
+                input_data = _json_loads(data)
             elif fmt == "yaml":
-                if yaml is None:
+                try:
+                    import yaml  # type: ignore
+                    loader = yaml_loader()
+                except Exception:  # optional
                     print(
                         "Error: PyYAML not available. Install pyyaml or use --format json.",
                         file=sys.stderr,
                     )
                     sys.exit(1)
-                input_data = yaml.safe_load(text)
+                input_data = yaml.load(data, Loader=loader)
             else:
                 print(f"Error: Unsupported format: {fmt}", file=sys.stderr)
                 sys.exit(1)
@@ -155,7 +216,7 @@ def main():
                 parser.print_help()
                 sys.exit(1)
             try:
-                input_data = json.loads(input_str)
+                input_data = _json_loads(input_str)
             except json.JSONDecodeError:
                 print(
                     f"Error: Invalid JSON input provided.\n'{input_str}'", file=sys.stderr
@@ -163,48 +224,47 @@ def main():
                 sys.exit(1)
 
     try:
-        template_env = Environment(
-            loader=PackageLoader("cpo_tools", "templates"),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
         # If using registry-only trait generation, resolve cpo_name from registry and skip full processing
         ctx = None
         if args.from_registry and (args.trait_impl_only or args.impl_target):
             # Try to read registry
             try:
                 reg_path = Path(args.registry_path)
-                reg = json.loads(reg_path.read_text()) if reg_path.exists() else None
+                st = reg_path.stat() if reg_path.exists() else None
+                by_key = _load_registry_index(str(reg_path), st.st_mtime_ns, st.st_size) if st else None
             except Exception as e:
                 print(f"Warning: Failed to read registry at {reg_path}: {e}", file=sys.stderr)
-                reg = None
+                by_key = None
 
             cpo_name = None
-            if reg:
-                key = args.from_registry
+            if by_key:
                 # Match by struct or tag name
-                for entry in reg:
+                entry = by_key.get(args.from_registry)
+                if entry:
                     struct = entry.get("struct")
-                    name = entry.get("name")
-                    if key == struct or key == name:
-                        # Prefer struct-derived base (strip _ftor)
-                        if struct and struct.endswith("_ftor"):
-                            cpo_name = struct[:-5]
-                        elif struct:
-                            cpo_name = struct
-                        else:
-                            cpo_name = name
-                        break
+                    # Prefer struct-derived base (strip _ftor)
+                    if struct and struct.endswith("_ftor"):
+                        cpo_name = struct[:-5]
+                    elif struct:
+                        cpo_name = struct
+                    else:
+                        cpo_name = entry.get("name")
             # Fallback: use provided key directly
             if not cpo_name:
                 cpo_name = args.from_registry
                 if cpo_name.endswith("_ftor"):
                     cpo_name = cpo_name[:-5]
 
-            ctx = {"cpo_name": cpo_name, "has_generics": False, "arg_pairs": "", "arg_types": "", "llm_metadata": {}}
+            ctx = _minimal_ctx(cpo_name)
+
+        if ctx is None and args.trait_impl_only and args.impl_target:
+            # The spec is still validated, but the CPO body would be discarded, so skip its render
+            from cpo_tools.src.process import parse_input
 
-        if ctx is None:
-            generated_code, ctx = process_input(input_data, args.doxygen, template_env)
+            _, ctx, _ = parse_input(input_data, args.doxygen)
+            generated_code = ""
+        elif ctx is None:
+            generated_code, ctx = _render_cpo_with_ctx(input_data, args.doxygen)
         else:
             generated_code = ""  # Will be replaced if not trait-only
 
@@ -220,7 +280,7 @@ def main():
                 returns_void = False
                 llm = ctx.get("llm_metadata") or {}
                 if (
-                    isinstance(llm, dict)
+                    isinstance(llm, Mapping)
                     and llm.get("return_constraint") == "returns_void_c"
                 ):
                     returns_void = True
@@ -246,7 +306,9 @@ def main():
             if not args.impl_target:
                 print("Error: --emit-trait-impl requires --impl-target TYPE (e.g., 'Kokkos::View<T>' or 'Kokkos::View<...>')", file=sys.stderr)
                 sys.exit(1)
-            trait_code = render_trait_impl(template_env, ctx["cpo_name"], args.impl_target, ctx)
+            from cpo_tools.src.trait_impl import render_trait_impl
+
+            trait_code = render_trait_impl(_get_env(), ctx["cpo_name"], args.impl_target, ctx)
             if args.impl_guard:
                 trait_code = f"#ifdef {args.impl_guard}\n{trait_code}\n#endif\n"
             if args.trait_impl_only:
@@ -259,7 +321,9 @@ def main():
             if not args.impl_target:
                 print("Error: --emit-adl-shim requires --impl-target TYPE to know the receiver type.", file=sys.stderr)
                 sys.exit(1)
-            shim_code = render_adl_shim(template_env, ctx["cpo_name"], args.impl_target, args.shim_namespace)
+            from cpo_tools.src.shim_impl import render_adl_shim
+
+            shim_code = render_adl_shim(_get_env(), ctx["cpo_name"], args.impl_target, args.shim_namespace)
             generated_code = generated_code.rstrip() + "\n\n" + shim_code
 
         if args.namespace or args.with_include:
@@ -267,9 +331,10 @@ def main():
                 generated_code, args.namespace, args.with_include
             )
 
-        # Strip all $ and ' symbols since they're not valid in C++ and were only used for parsing
-        clean_generated_code = generated_code.replace('$', '').replace("'", '')
-        
+        # The stub, trait and shim emitters read the unstripped ctx, so strip
+        # the $ and ' parse markers from their output too
+        clean_generated_code = generated_code.translate(_STRIP_PARSE_MARKERS)
+
         write_output(
             args.out_path,
             clean_generated_code,
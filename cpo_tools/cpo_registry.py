@@ -19,14 +19,27 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
 
-TAG_RE = re.compile(r"\b(TINCUP_CPO_TAG|CPO_TAG)\s*\(\s*\"([^\"]+)\"\s*\)")
-STRUCT_RE = re.compile(r"\bstruct\s+([a-zA-Z_][a-zA-Z0-9_]*)\b")
+# Struct declarations and CPO tag macros, matched in one pass per line.
+# Headers are scanned as bytes with ASCII-only \b/\s semantics.
+CPO_LINE_RE = re.compile(
+    rb"\bstruct\s+(?P<struct>[a-zA-Z_][a-zA-Z0-9_]*)\b"
+    rb"|\b(?:TINCUP_CPO_TAG|CPO_TAG)\s*\(\s*\"(?P<tag>[^\"]+)\"\s*\)",
+    re.ASCII,
+)
+
+HEADER_SUFFIXES = (".hpp", ".hh", ".h")
+
+# Starting a process pool costs ~5 ms and a typical header scans in ~0.1 ms,
+# so with two or more cores the pool only pays off past about a hundred files
+PARALLEL_MIN_FILES = 128
 
 
 @dataclass
@@ -40,50 +53,57 @@ class CPOEntry:
 
 def scan_file(path: Path) -> List[CPOEntry]:
     entries: List[CPOEntry] = []
-    try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
-        return entries
-
     struct_name = None
-    # Track last seen struct to associate with the macro placement
-    for i, line in enumerate(text.splitlines(), start=1):
-        s = STRUCT_RE.search(line)
-        if s:
-            struct_name = s.group(1)
-
-        m = TAG_RE.search(line)
-        if m:
-            tag_name = m.group(2)
-            entries.append(
-                CPOEntry(
-                    name=tag_name,
-                    qualified=f"tincup::{tag_name}",
-                    header=str(path),
-                    struct=struct_name,
-                    line=i,
-                )
-            )
+    try:
+        # Stream lines as bytes; avoids decoding and materializing the whole file
+        with open(path, "rb") as f:
+            # Track last seen struct to associate with the macro placement
+            for i, line in enumerate(f, start=1):
+                # Cheap substring gate; most lines match neither alternative
+                if b"CPO_TAG" not in line and b"struct" not in line:
+                    continue
+                matches = CPO_LINE_RE.findall(line)
+                # A struct on the line owns its tags even when a tag precedes it
+                line_struct = next((s for s, _ in matches if s), None)
+                if line_struct is not None:
+                    struct_name = line_struct.decode("ascii")
+                for _, tag in matches:
+                    if not tag:
+                        continue
+                    tag_name = tag.decode("utf-8", errors="ignore")
+                    entries.append(
+                        CPOEntry(
+                            name=tag_name,
+                            qualified=f"tincup::{tag_name}",
+                            header=str(path),
+                            struct=struct_name,
+                            line=i,
+                        )
+                    )
+    except OSError:
+        return []
     return entries
 
 
-def scan_root(root: Path) -> List[CPOEntry]:
-    patterns = ("*.hpp", "*.hh", "*.h")
+def scan_root(root: Path, jobs: Optional[int] = None) -> List[CPOEntry]:
+    # One traversal for all header suffixes; hidden directories (.git, ...) are pruned
     files = []
-    for pat in patterns:
-        files.extend(root.rglob(pat))
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        files.extend(
+            Path(dirpath) / name for name in filenames if name.endswith(HEADER_SUFFIXES)
+        )
     all_entries: List[CPOEntry] = []
-    for f in files:
-        all_entries.extend(scan_file(f))
-    # De-duplicate by (name, header, line)
-    seen = set()
-    uniq: List[CPOEntry] = []
-    for e in all_entries:
-        key = (e.name, e.header, e.line)
-        if key in seen:
-            continue
-        seen.add(key)
-        uniq.append(e)
+    if jobs == 1 or len(files) < PARALLEL_MIN_FILES:
+        for f in files:
+            all_entries.extend(scan_file(f))
+    else:
+        # Files are scanned independently; results come back in input order
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            for entries in ex.map(scan_file, files, chunksize=16):
+                all_entries.extend(entries)
+    # De-duplicate by (name, header, line); dicts keep first-seen key order
+    uniq = list({(e.name, e.header, e.line): e for e in all_entries}.values())
     # Sort by name then header
     uniq.sort(key=lambda x: (x.name, x.header, x.line))
     return uniq
@@ -91,30 +111,45 @@ def scan_root(root: Path) -> List[CPOEntry]:
 
 def write_outputs(entries: List[CPOEntry], out_dir: Path) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    # JSON
-    (out_dir / "cpo_registry.json").write_text(
-        json.dumps([asdict(e) for e in entries], indent=2), encoding="utf-8"
+    # JSON (CPOEntry holds only flat scalars, so vars() suffices; asdict() deep-copies)
+    (out_dir / "cpo_registry.json").write_bytes(
+        json.dumps([vars(e) for e in entries], indent=2).encode("utf-8")
     )
     # Markdown
     md_lines = ["# TInCuP CPO Registry", "", f"Total: {len(entries)}", ""]
-    for e in entries:
-        loc = f"{Path(e.header)}:{e.line}"
-        struct = f" (struct {e.struct})" if e.struct else ""
-        md_lines.append(f"- `{e.name}`: `{e.qualified}` — {loc}{struct}")
-    (out_dir / "cpo_registry.md").write_text(
-        "\n".join(md_lines) + "\n", encoding="utf-8"
+    # header is already str(path), so format it directly
+    md_lines.extend(
+        f"- `{e.name}`: `{e.qualified}` — {e.header}:{e.line}"
+        f"{f' (struct {e.struct})' if e.struct else ''}"
+        for e in entries
     )
+    (out_dir / "cpo_registry.md").write_bytes(
+        ("\n".join(md_lines) + "\n").encode("utf-8")
+    )
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
 
 
 def main() -> int:
     ap = argparse.ArgumentParser(description="Generate TInCuP CPO registry")
     ap.add_argument("--root", default="include", help="Root directory to scan")
     ap.add_argument("--out", default="docs", help="Output directory for registry files")
+    ap.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help="Worker processes for scanning large trees (default: CPU count; 1 disables)",
+    )
     args = ap.parse_args()
 
     root = Path(args.root).resolve()
     out = Path(args.out).resolve()
-    entries = scan_root(root)
+    entries = scan_root(root, args.jobs)
     write_outputs(entries, out)
     print(f"Found {len(entries)} CPOs. Wrote {out}/cpo_registry.json and .md")
     return 0
@@ -14,58 +14,254 @@ Demonstrates the missing components needed for robust regex-based CPO refactorin
 """
 import re
 import os
-from typing import List, Dict, Tuple, Optional
+import mmap
+import itertools
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from typing import Iterator, List, Dict, Tuple, Optional
+
+# Patterns are compiled once at import; verification runs them per CPO/file.
+# Comments and string/char literals in one alternation; literals are matched so
+# that comment markers inside them are left alone. Raw strings may span lines,
+# other literals do not. A quote right after an identifier character or digit
+# is a digit separator (1'000), not the start of a char literal, unless it
+# follows an encoding prefix (u8'x', L'x').
+_COMMENT_OR_LITERAL = re.compile(
+    r"//[^\n]*|/\*.*?\*/"
+    r"|\b(?:u8|[uUL])?R\"(?P<delim>[^()\\\s\"]{0,16})\(.*?\)(?P=delim)\""
+    r"|\"(?:\\.|[^\"\\\n])*\""
+    r"|(?:\b(?:u8|[uUL])|(?<!\w))'(?:\\.|[^'\\\n])*'",
+    re.DOTALL,
+)
+# Allow optional namespace qualifiers before cpo_base (e.g., tincup::cpo_base)
+_CPO_STRUCT = re.compile(r"struct\s+(\w+)_ftor\s+final\s*:\s*(?:[\w:]+::)?cpo_base<\1_ftor>")
+_TEMPLATE = re.compile(r"template<([^>]+)>")
+# Non-empty operator() parameter list; searched from the positive requires clause
+# rather than via a lazy DOTALL ".*?" that rescans the rest of the CPO per attempt
+_POSITIVE_REQUIRES = "requires tag_invocable_c<"
+_FN_SIG = re.compile(r"operator\(\)\s*\(([^)]+)\)")
+_FWD_REF = re.compile(r"(\w+)&&\s+(\w+)")
+# operator() whose requires/noexcept/return all use the concept family
+_OP_FAMILY = re.compile(
+    r"requires\s+tincup::invocable_c<([^>]+)>\s*"
+    r"constexpr\s+auto\s+operator\(\)\s*\([^)]*\)\s*const\s*"
+    r"noexcept\(tincup::nothrow_invocable_c<([^>]+)>\)\s*"
+    r"->\s*tincup::invocable_t<([^>]+)>"
+)
+# Facts shared by several checks, collected in a single pass over each CPO.
+# Every alternative starts with its own literal, so matches never overlap.
+_CPO_FACTS = re.compile(
+    r"(?P<noexcept>noexcept\(nothrow_tag_invocable_c<(?P<noexcept_args>[^>]+)>\))"
+    r"|(?P<family>tincup::(?P<family_kind>invocable_c|nothrow_invocable_c|invocable_t)"
+    r"<(?P<family_args>[^>]+)>)"
+    r"|(?P<params>operator\(\)\s*\((?P<param_list>[^)]*)\))"
+    r"|(?P<flag>\binline\s+static\s+constexpr\s+bool\s+"
+    r"(?P<flag_name>is_variadic|has_variadic_params)\s*=\s*(?P<flag_value>true|false)\s*;)"
+)
+_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# ASCII whitespace deletion table for normalizing template argument lists
+_WS_TABLE = str.maketrans("", "", " \t\n\r\v\f")
+_SPACING_COLON = re.compile(r"\s*:\s*")
+_SPACING_BRACE = re.compile(r"\s*{\s*")
+_BRACE = re.compile(r"[{}]")
+_CALL_OPERATOR = re.compile(r"operator\(\)\s*\(")
+_TRAILING_SEMI = re.compile(r"\s*;")
+
+
+def _strip_comment(match) -> str:
+    text = match.group(0)
+    return "" if text.startswith("/") else text
+
+
+def _scan_facts(content: str) -> Dict[str, object]:
+    """Collect identifiers and noexcept, concept family, parameter list and variadic flag uses."""
+    facts = {"noexcept": [], "family": [], "params": [], "is_variadic": [], "has_variadic_params": []}
+    facts["tokens"] = set(_IDENT.findall(content))
+    for m in _CPO_FACTS.finditer(content):
+        kind = m.lastgroup
+        if kind == "noexcept":
+            facts["noexcept"].append(m.group("noexcept_args"))
+        elif kind == "family":
+            facts["family"].append((m.group("family_kind"), m.group("family_args")))
+        elif kind == "params":
+            facts["params"].append(m.group("param_list"))
+        else:
+            facts[m.group("flag_name")].append(m.group("flag_value"))
+    return facts
+
+
+# Verifiers built by CPOVerifier.from_path, most recently used last:
+# path -> ((st_mtime_ns, st_size), verifier or None for files without CPOs)
+_PARSE_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Optional[CPOVerifier]]]" = OrderedDict()
+_PARSE_CACHE_MAX = 2048
+
+# Starting a process pool costs ~5 ms and verifying one CPO file ~0.25 ms, so
+# with two or more cores the pool pays off once a tree has a few dozen CPO files
+PARALLEL_MIN_FILES = 32
+
+# Source file extensions considered when scanning a project for CPOs
+_CPO_EXTS = frozenset(("hpp", "h", "cpp", "cc"))
+
+
+def _iter_sources(root: str) -> Iterator[str]:
+    """Yield C++ source paths under root using scandir's cached entry types.
+
+    Unreadable directories are skipped, as os.walk does by default.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1][1:] in _CPO_EXTS and entry.is_file():
+                    yield entry.path
+
+
+def _find_block_end(content: str, start_pos: int) -> int:
+    """Return the end of the first brace block at or after start_pos, past any trailing ';'."""
+    brace_count = 0
+    found_first_brace = False
+
+    # Jump from brace to brace instead of stepping through every character
+    for match in _BRACE.finditer(content, start_pos):
+        if match.group() == "{":
+            brace_count += 1
+            found_first_brace = True
+        else:
+            brace_count -= 1
+            if found_first_brace and brace_count == 0:
+                # Look for the semicolon after the closing brace
+                semi = _TRAILING_SEMI.match(content, match.end())
+                return semi.end() if semi else match.end()
+    return len(content)
+
+
+def _read_if_cpo(filepath: str) -> Optional[bytes]:
+    """Return the raw bytes of filepath if it mentions cpo_base<, else None.
+
+    The check runs on an mmap, so files without CPOs are never copied into Python.
+    """
+    with open(filepath, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"cpo_base<") == -1:
+                    return None
+                return mm[:]
+        except ValueError:  # empty file
+            return None
+
+
+def _iter_cpo_files(root: str, jobs: Optional[int] = None) -> Iterator[Tuple[str, bytes]]:
+    """Yield (path, contents) for CPO files under root as reader threads find them.
+
+    At most a few reads per worker are in flight, so directory enumeration
+    overlaps with file inspection and with the consumer. Hits come back in
+    completion order rather than walk order.
+    """
+    workers = jobs or (os.cpu_count() or 1) * 4
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = {}
+        for path in _iter_sources(root):
+            pending[ex.submit(_read_if_cpo, path)] = path
+            if len(pending) < workers * 2:
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                data = future.result()
+                if data is not None:
+                    yield path, data
+        for future in as_completed(pending):
+            data = future.result()
+            if data is not None:
+                yield pending[future], data
+
+
+def _decode_source(data: bytes) -> str:
+    """Decode like a text-mode read: UTF-8 with universal newlines.
+
+    Decoding is strict; UnicodeDecodeError is raised for non-UTF-8 input.
+    """
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
 
 
 class CPOVerifier:
-    def __init__(self, filename):
+    def __init__(self, filename, content: Optional[str] = None):
         self.filename = filename
-        with open(filename, "r") as f:
-            self.content = f.read()
+        if content is None:
+            with open(filename, "r") as f:
+                content = f.read()
+        self.content = content
         # Remove comments to avoid false matches
         self.cleaned_content = self.remove_comments(self.content)
+        # Per-CPO scan results, keyed by CPO content
+        self._facts = {}
+        self._cpos = None
+
+    @classmethod
+    def from_source(cls, text: str, name: str = "<memory>") -> "CPOVerifier":
+        """Build a verifier for in-memory source text; name is used in reports."""
+        return cls(name, text)
+
+    @classmethod
+    def from_path(cls, path: str) -> Optional["CPOVerifier"]:
+        """Build a verifier for path, or return None if it defines no CPOs.
+
+        Files without the cpo_base< sentinel are rejected on the raw bytes,
+        before any decoding or comment stripping. Results are cached per path
+        and reused while the file's mtime and size are unchanged. Raises
+        UnicodeDecodeError if a file with the sentinel is not valid UTF-8.
+        """
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            _PARSE_CACHE.move_to_end(path)
+            return cached[1]
+
+        data = _read_if_cpo(path)
+        verifier = None if data is None else cls(path, _decode_source(data))
+        _PARSE_CACHE[path] = (stamp, verifier)
+        _PARSE_CACHE.move_to_end(path)
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+            _PARSE_CACHE.popitem(last=False)
+        return verifier
+
+    def facts(self, cpo) -> Dict[str, object]:
+        """Return the single-pass scan results for cpo, computing them once."""
+        content = cpo["content"]
+        facts = self._facts.get(content)
+        if facts is None:
+            facts = self._facts[content] = _scan_facts(content)
+        return facts
 
     def remove_comments(self, content: str) -> str:
         """Remove C++ comments while preserving string literals."""
-        # Remove single-line comments (but not in string literals)
-        content = re.sub(r"//.*$", "", content, flags=re.MULTILINE)
-        # Remove multi-line comments (but not in string literals)
-        content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
-        return content
+        # Single pass: drop comments, keep literals verbatim
+        return _COMMENT_OR_LITERAL.sub(_strip_comment, content)
 
     def find_cpo_end(self, start_pos: int) -> int:
         """Find the end of a CPO definition by matching braces."""
-        brace_count = 0
-        i = start_pos
-        found_first_brace = False
-
-        while i < len(self.cleaned_content):
-            char = self.cleaned_content[i]
-            if char == "{":
-                brace_count += 1
-                found_first_brace = True
-            elif char == "}":
-                brace_count -= 1
-                if found_first_brace and brace_count == 0:
-                    # Look for the semicolon after the closing brace
-                    j = i + 1
-                    while (
-                        j < len(self.cleaned_content)
-                        and self.cleaned_content[j].isspace()
-                    ):
-                        j += 1
-                    if j < len(self.cleaned_content) and self.cleaned_content[j] == ";":
-                        return j + 1
-                    return i + 1
-            i += 1
-        return len(self.cleaned_content)
+        return _find_block_end(self.cleaned_content, start_pos)
 
     def find_cpo_definitions(self):
         """Find all CPO definitions in the file."""
+        if self._cpos is None:
+            self._cpos = self._find_cpo_definitions()
+        return list(self._cpos)
+
+    def _find_cpo_definitions(self):
+        # Cheap substring checks rule out most files before the backreference regex
+        if "_ftor" not in self.cleaned_content or "cpo_base<" not in self.cleaned_content:
+            return []
+
         # Look for the characteristic pattern of a CPO definition
-        # Allow optional namespace qualifiers before cpo_base (e.g., tincup::cpo_base)
-        pattern = r"struct\s+(\w+)_ftor\s+final\s*:\s*(?:[\w:]+::)?cpo_base<\1_ftor>"
-        matches = re.finditer(pattern, self.cleaned_content)
+        matches = _CPO_STRUCT.finditer(self.cleaned_content)
 
         cpos = []
         for match in matches:
@@ -81,9 +277,12 @@ class CPOVerifier:
             )
         return cpos
 
-    def verify_cpo_structure(self, cpo):
+    # The verify_* checks append to ``errors`` when a list is passed in, so
+    # callers running several checks can share one list; it is also returned.
+    def verify_cpo_structure(self, cpo, errors: Optional[List[str]] = None) -> List[str]:
         """Verify that a CPO follows the required pattern."""
-        errors = []
+        if errors is None:
+            errors = []
         name = cpo["name"]
         content = cpo["content"]
 
@@ -107,32 +306,32 @@ class CPOVerifier:
             f"{name}_return_t",
         ]
 
+        # Alias names are whole identifiers: answer from the token index
+        tokens = self.facts(cpo)["tokens"]
         for alias in expected_aliases:
-            if alias not in content:
+            if alias not in tokens:
                 errors.append(f"Missing concept alias: {alias}")
 
         return errors
 
-    def verify_noexcept_propagation(self, cpo):
+    def verify_noexcept_propagation(self, cpo, errors: Optional[List[str]] = None) -> List[str]:
         """Verify that noexcept is properly propagated."""
+        if errors is None:
+            errors = []
         # Extract the noexcept condition from the first operator()
-        noexcept_pattern = r"noexcept\(nothrow_tag_invocable_c<([^>]+)>\)"
-        matches = re.findall(noexcept_pattern, cpo["content"])
+        matches = self.facts(cpo)["noexcept"]
 
         if len(matches) != 1:
-            return ["Incorrect number of noexcept specifications"]
-
+            errors.append("Incorrect number of noexcept specifications")
         # Verify the condition matches the CPO name and arguments
-        expected = f"{cpo['name']}_ftor"
-        if expected not in matches[0]:
-            return [f"Noexcept specification doesn't match CPO name"]
+        elif f"{cpo['name']}_ftor" not in matches[0]:
+            errors.append("Noexcept specification doesn't match CPO name")
 
-        return []
+        return errors
 
     def extract_template_parameters(self, cpo) -> List[str]:
         """Extract template parameters from operator() definitions."""
-        template_pattern = r"template<([^>]+)>"
-        matches = re.findall(template_pattern, cpo["content"])
+        matches = _TEMPLATE.findall(cpo["content"])
 
         if not matches:
             return []
@@ -144,48 +343,55 @@ class CPOVerifier:
     def extract_function_signature(self, cpo) -> Optional[str]:
         """Extract the function signature from the positive operator() overload."""
         # Look for the positive requires clause operator()
-        pattern = r"requires tag_invocable_c<.*?operator\(\)\s*\(([^)]+)\)"
-        match = re.search(pattern, cpo["content"], re.DOTALL)
+        content = cpo["content"]
+        start = content.find(_POSITIVE_REQUIRES)
+        if start == -1:
+            return None
+        match = _FN_SIG.search(content, start + len(_POSITIVE_REQUIRES))
 
         if match:
             return match.group(1).strip()
         return None
 
-    def verify_forwarding_correctness(self, cpo):
+    def verify_forwarding_correctness(self, cpo, errors: Optional[List[str]] = None) -> List[str]:
         """Verify that forwarding references are handled correctly."""
-        errors = []
+        if errors is None:
+            errors = []
         content = cpo["content"]
 
-        # Look for T&& parameters in the signature
-        forwarding_refs = re.findall(r"(\w+)&&\s+(\w+)", content)
-
-        for type_name, param_name in forwarding_refs:
+        # Look for T&& parameters in the signature; each pair is checked once
+        seen = set()
+        for match in _FWD_REF.finditer(content):
+            type_name, param_name = match.groups()
+            if (type_name, param_name) in seen:
+                continue
+            seen.add((type_name, param_name))
             # Check that std::forward<T>(param) is used in tag_invoke call
-            forward_pattern = f"std::forward<{type_name}>\\({param_name}\\)"
-            if forward_pattern not in content:
+            if f"std::forward<{type_name}>({param_name})" not in content:
                 errors.append(
                     f"Missing std::forward<{type_name}>({param_name}) for forwarding reference"
                 )
 
         return errors
 
-    def verify_concept_family_consistency(self, cpo):
+    def verify_concept_family_consistency(self, cpo, errors: Optional[List[str]] = None) -> List[str]:
         """Verify that all tincup:: concept family uses have identical argument substitution."""
-        errors = []
+        if errors is None:
+            errors = []
         name = cpo["name"]
         content = cpo["content"]
         
         # Extract all uses of tincup::invocable_c, nothrow_invocable_c, and invocable_t
-        invocable_pattern = r"tincup::(invocable_c|nothrow_invocable_c|invocable_t)<([^>]+)>"
-        matches = re.findall(invocable_pattern, content)
+        matches = self.facts(cpo)["family"]
         
-        if not matches:
-            return errors  # No concept family uses found
+        # A single use cannot disagree, and the operator() check needs three
+        if len(matches) <= 1:
+            return errors
         
         # Normalize whitespace for comparison
         def normalize_args(args_str):
             # Remove all whitespace and normalize for comparison
-            return re.sub(r'\s+', '', args_str)
+            return args_str.translate(_WS_TABLE)
         
         # Group matches by concept type
         invocable_args = []
@@ -205,26 +411,23 @@ class CPOVerifier:
         # All argument lists should be identical (up to whitespace)
         all_args = invocable_args + nothrow_invocable_args + invocable_t_args
         
-        if len(set(all_args)) > 1:
-            unique_args = list(set(all_args))
-            errors.append(
-                f"Inconsistent argument substitution in {name} concept family. "
-                f"Found {len(unique_args)} different patterns: {unique_args[:2]}..."
-            )
+        unique_args = set(all_args)
+        if len(unique_args) <= 1:
+            # operator() uses are among these matches, so they agree as well
+            return errors
+
+        unique_args = list(unique_args)
+        errors.append(
+            f"Inconsistent argument substitution in {name} concept family. "
+            f"Found {len(unique_args)} different patterns: {unique_args[:2]}..."
+        )
         
         # Check that operator() requires/noexcept/return all use the same args
         if all_args:
             canonical_args = all_args[0]
             
-            # Pattern to match operator() with all three uses
-            operator_pattern = (
-                r"requires\s+tincup::invocable_c<([^>]+)>\s*"
-                r"constexpr\s+auto\s+operator\(\)\s*\([^)]*\)\s*const\s*"
-                r"noexcept\(tincup::nothrow_invocable_c<([^>]+)>\)\s*"
-                r"->\s*tincup::invocable_t<([^>]+)>"
-            )
-            
-            operator_matches = re.search(operator_pattern, content, re.DOTALL)
+            # Match operator() with all three uses
+            operator_matches = _OP_FAMILY.search(content)
             if operator_matches:
                 requires_args = normalize_args(operator_matches.group(1))
                 noexcept_args = normalize_args(operator_matches.group(2))  
@@ -238,15 +441,16 @@ class CPOVerifier:
         
         return errors
 
-    def verify_variadic_flag(self, cpo):
+    def verify_variadic_flag(self, cpo, errors: Optional[List[str]] = None) -> List[str]:
         """Require presence of is_variadic flag and ensure it matches signature ellipses usage."""
-        errors = []
-        content = cpo["content"]
+        if errors is None:
+            errors = []
         name = cpo["name"]
+        facts = self.facts(cpo)
 
         # Look for is_variadic or (legacy) has_variadic_params
-        is_variadic_match = re.search(r"\binline\s+static\s+constexpr\s+bool\s+is_variadic\s*=\s*(true|false)\s*;", content)
-        legacy_match = re.search(r"\binline\s+static\s+constexpr\s+bool\s+has_variadic_params\s*=\s*(true|false)\s*;", content)
+        is_variadic_match = facts["is_variadic"]
+        legacy_match = facts["has_variadic_params"]
 
         if not is_variadic_match and not legacy_match:
             errors.append(f"{name}: missing inline static constexpr bool is_variadic flag (or legacy has_variadic_params)")
@@ -254,13 +458,13 @@ class CPOVerifier:
 
         flag_value = None
         if is_variadic_match:
-            flag_value = (is_variadic_match.group(1) == 'true')
+            flag_value = (is_variadic_match[0] == 'true')
         elif legacy_match:
-            flag_value = (legacy_match.group(1) == 'true')
+            flag_value = (legacy_match[0] == 'true')
 
         # Extract operator() parameter lists and detect any '...' occurrences inside
         # This detects template parameter packs in generated signatures
-        param_lists = re.findall(r"operator\(\)\s*\(([^)]*)\)", content)
+        param_lists = facts["params"]
         has_ellipsis = any('...' in params for params in param_lists)
 
         if flag_value and not has_ellipsis:
@@ -280,16 +484,33 @@ class CPOTransformer:
     def standardize_spacing(self) -> str:
         """Standardize whitespace in CPO definitions."""
         # Standardize spacing around operators, braces, etc.
-        content = re.sub(r"\s*:\s*", " : ", self.content)
-        content = re.sub(r"\s*{\s*", " {\n    ", content)
+        content = _SPACING_COLON.sub(" : ", self.content)
+        content = _SPACING_BRACE.sub(" {\n    ", content)
         return content
 
     def update_cpo_signature(self, cpo_name: str, old_sig: str, new_sig: str) -> str:
-        """Update operator() signature across a CPO definition."""
-        # This would need more sophisticated logic to handle all occurrences
-        pattern = f"(struct\\s+{cpo_name}_ftor.*?operator\\(\\)\\s*\\()[^)]*?\\)"
-        replacement = f"\\1{new_sig})"
-        return re.sub(pattern, replacement, self.content, flags=re.DOTALL)
+        """Update every operator() signature in a CPO definition."""
+        content = self.content
+        # Same shape as _CPO_STRUCT, for this CPO only: forward declarations and
+        # structs whose names merely start with "<cpo_name>_ftor" are skipped
+        ftor = re.escape(f"{cpo_name}_ftor")
+        struct = re.search(
+            rf"struct\s+{ftor}\s+final\s*:\s*(?:[\w:]+::)?cpo_base<{ftor}>", content
+        )
+        if struct is None:
+            return content
+
+        # Collect each operator() parameter list in the struct body, then splice
+        # back to front so earlier offsets stay valid
+        end = _find_block_end(content, struct.end())
+        spans = []
+        for op in _CALL_OPERATOR.finditer(content, struct.end(), end):
+            close = content.find(")", op.end(), end)
+            if close != -1:
+                spans.append((op.end(), close))
+        for start, close in reversed(spans):
+            content = content[:start] + new_sig + content[close:]
+        return content
 
     def regenerate_concept_aliases(
         self, cpo_name: str, template_params: str, concept_types: str
@@ -316,39 +537,112 @@ class CPORefactoring:
     def __init__(self, project_root: str):
         self.project_root = project_root
 
-    def find_all_cpo_files(self) -> List[str]:
-        """Find all files containing CPO definitions."""
-        cpo_files = []
-        for root, dirs, files in os.walk(self.project_root):
-            for file in files:
-                if file.endswith((".hpp", ".h", ".cpp", ".cc")):
-                    filepath = os.path.join(root, file)
-                    with open(filepath, "r") as f:
-                        content = f.read()
-                        if "cpo_base<" in content:
-                            cpo_files.append(filepath)
-        return cpo_files
-
-    def migrate_all_cpos(self, migration_rules: Dict[str, str]):
-        """Apply migration rules across all CPO files."""
-        files = self.find_all_cpo_files()
-
-        for file_path in files:
-            verifier = CPOVerifier(file_path)
-            cpos = verifier.find_cpo_definitions()
-
-            # Apply transformations
-            transformer = CPOTransformer(verifier.content)
-            new_content = transformer.content
-
-            for rule_name, rule_pattern in migration_rules.items():
-                new_content = re.sub(
-                    rule_pattern["from"], rule_pattern["to"], new_content
-                )
+    def find_all_cpo_files(self) -> Iterator[str]:
+        """Yield all files containing CPO definitions, in no particular order."""
+        for path, _ in _iter_cpo_files(self.project_root):
+            yield path
+
+    def migrate_all_cpos(self, migration_rules: Dict[str, str], jobs: Optional[int] = None) -> List[str]:
+        """Apply migration rules across all CPO files.
+
+        Files are rewritten from the bytes read for the CPO check. Each file is
+        written only by its own task, so large trees are migrated on a process
+        pool once discovery has finished and its reader threads have exited;
+        jobs sizes both the reader threads and the process pool. Files that are
+        not valid UTF-8 are left untouched; their paths are reported and returned.
+        """
+        # Compile each rule once for the whole tree, not once per file
+        compiled_rules = [
+            (re.compile(rule_pattern["from"]), rule_pattern["to"])
+            for rule_pattern in migration_rules.values()
+        ]
+        # Forking while the discovery threads are alive can deadlock the
+        # children, so the pool is only created after the walk completes
+        found = list(_iter_cpo_files(self.project_root, jobs))
+        skipped = []
+
+        def finish(path: str, error: Optional[str]):
+            _PARSE_CACHE.pop(path, None)
+            if error is not None:
+                print(f"Skipping {path}: {error}")
+                skipped.append(path)
+
+        if jobs == 1 or len(found) < PARALLEL_MIN_FILES:
+            for path, data in found:
+                finish(path, _migrate_source(path, data, compiled_rules))
+            return skipped
+
+        paths = [path for path, _ in found]
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            errors = ex.map(
+                _migrate_source,
+                paths,
+                [data for _, data in found],
+                itertools.repeat(compiled_rules),
+                chunksize=16,
+            )
+            for path, error in zip(paths, errors):
+                finish(path, error)
+        return skipped
+
 
-            # Write back transformed content
-            with open(file_path, "w") as f:
-                f.write(new_content)
+def _verify_file(path: str) -> List[Tuple[Optional[str], List[str]]]:
+    """Run every check on each CPO in path; returns (cpo name, errors) pairs.
+
+    A file that cannot be decoded yields a single pair with name None.
+    """
+    try:
+        verifier = CPOVerifier.from_path(path)
+    except UnicodeDecodeError as exc:
+        return [(None, [f"not valid UTF-8 ({exc.reason} at byte {exc.start}); not verified"])]
+    if verifier is None:
+        return []
+    results = []
+    for cpo in verifier.find_cpo_definitions():
+        errors = []
+        verifier.verify_cpo_structure(cpo, errors)
+        verifier.verify_noexcept_propagation(cpo, errors)
+        verifier.verify_forwarding_correctness(cpo, errors)
+        verifier.verify_concept_family_consistency(cpo, errors)
+        verifier.verify_variadic_flag(cpo, errors)
+        results.append((cpo["name"], errors))
+    return results
+
+
+def _migrate_source(
+    path: str, data: bytes, compiled_rules: List[Tuple[re.Pattern, str]]
+) -> Optional[str]:
+    """Apply compiled migration rules to the contents of a CPO file and write it back.
+
+    Returns None on success, or a reason if the file was left unchanged.
+    """
+    # Decode once from the bytes already read by the discovery gate
+    try:
+        new_content = CPOTransformer(_decode_source(data)).content
+    except UnicodeDecodeError as exc:
+        return f"not valid UTF-8 ({exc.reason} at byte {exc.start})"
+
+    for pattern, replacement in compiled_rules:
+        new_content = pattern.sub(replacement, new_content)
+
+    # Write back transformed content
+    with open(path, "w") as f:
+        f.write(new_content)
+    return None
+
+
+def _report(results: List[Tuple[Optional[str], List[str]]]):
+    for name, errors in results:
+        if name is None:
+            print("File could not be read:")
+            for error in errors:
+                print(f"  - {error}")
+        elif errors:
+            print(f"CPO '{name}' has issues:")
+            for error in errors:
+                print(f"  - {error}")
+        else:
+            print(f"CPO '{name}' is valid ✓")
 
 
 class CPODiagnostic:
@@ -388,28 +682,24 @@ def main():
     target = os.sys.argv[1]
 
     if os.path.isfile(target):
-        verifier = CPOVerifier(target)
-        cpos = verifier.find_cpo_definitions()
-
-        for cpo in cpos:
-            errors = verifier.verify_cpo_structure(cpo)
-            errors.extend(verifier.verify_noexcept_propagation(cpo))
-            errors.extend(verifier.verify_forwarding_correctness(cpo))
-            errors.extend(verifier.verify_concept_family_consistency(cpo))
-            errors.extend(verifier.verify_variadic_flag(cpo))
-
-            if errors:
-                print(f"CPO '{cpo['name']}' has issues:")
-                for error in errors:
-                    print(f"  - {error}")
-            else:
-                print(f"CPO '{cpo['name']}' is valid ✓")
+        _report(_verify_file(target))
 
     elif os.path.isdir(target):
         refactoring = CPORefactoring(target)
-        files = refactoring.find_all_cpo_files()
+        files = sorted(refactoring.find_all_cpo_files())
         print(f"Found {len(files)} files with CPOs")
 
+        # Files are independent, so verify them on all cores
+        if len(files) < PARALLEL_MIN_FILES:
+            results = list(map(_verify_file, files))
+        else:
+            with ProcessPoolExecutor() as ex:
+                results = list(ex.map(_verify_file, files, chunksize=16))
+        for path, file_results in zip(files, results):
+            if file_results:
+                print(f"{path}:")
+                _report(file_results)
+
 
 if __name__ == "__main__":
     main()
@@ -9,8 +9,8 @@
 import argparse
 
 
-def parse_args():
-    """Parse command-line arguments."""
+def parse_args(argv=None):
+    """Parse command-line arguments (sys.argv[1:] when argv is None)."""
     parser = argparse.ArgumentParser(
         description="CPO Generator for C++",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -178,5 +178,5 @@ Generic Naming Rule:
         action="store_true",
         help="Prepend #include <tincup/tincup.hpp> to the output.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     return args, parser
@@ -6,6 +6,8 @@
 #
 # Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
 
+from types import MappingProxyType
+
 LLM_OPERATION_PATTERNS = {
     "mutating_binary": {
         "description": "Modifies first object using second object",
@@ -68,6 +70,26 @@ LLM_OPERATION_PATTERNS = {
 }
 
 
+# Per-operation metadata is fixed, so build it once and share read-only views;
+# list values become tuples so the views are read-only all the way down
+_LLM_META = {
+    op_type: MappingProxyType(
+        {
+            "operation_type": op_type,
+            "description": pattern["description"],
+            "example_impl": pattern["example"],
+            "return_constraint": pattern["return_constraint"],
+            "implementation_hint": pattern.get("implementation_hint", ""),
+            "semantic_constraints": tuple(pattern.get("semantic_constraints", ())),
+            "requires_const_safe": pattern.get("requires_const_safe", False),
+            "requires_mutable": tuple(pattern.get("requires_mutable", ())),
+        }
+    )
+    for op_type, pattern in LLM_OPERATION_PATTERNS.items()
+}
+_LLM_AVAILABLE = ", ".join(LLM_OPERATION_PATTERNS)
+
+
 def detect_input_mode(input_data):
     """Detect whether input is from Vim or LLM interface."""
     if "operation_type" in input_data:
@@ -85,28 +107,17 @@ def process_llm_input(input_data):
     cpo_name = input_data["cpo_name"]
     operation_type = input_data["operation_type"]
 
-    if operation_type not in LLM_OPERATION_PATTERNS:
-        available = ", ".join(LLM_OPERATION_PATTERNS.keys())
+    meta = _LLM_META.get(operation_type)
+    if meta is None:
         raise ValueError(
-            f"Unknown operation_type '{operation_type}'. Available: {available}"
+            f"Unknown operation_type '{operation_type}'. Available: {_LLM_AVAILABLE}"
         )
 
-    pattern = LLM_OPERATION_PATTERNS[operation_type]
-
     vim_data = {
         "cpo_name": cpo_name,
-        "args": pattern["args"],
+        "args": list(LLM_OPERATION_PATTERNS[operation_type]["args"]),
         "doxygen": input_data.get("doxygen", False),
-        "_llm_metadata": {
-            "operation_type": operation_type,
-            "description": pattern["description"],
-            "example_impl": pattern["example"],
-            "return_constraint": pattern["return_constraint"],
-            "implementation_hint": pattern.get("implementation_hint", ""),
-            "semantic_constraints": pattern.get("semantic_constraints", []),
-            "requires_const_safe": pattern.get("requires_const_safe", False),
-            "requires_mutable": pattern.get("requires_mutable", []),
-        },
+        "_llm_metadata": meta,
     }
     return vim_data
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Optional
+import os
 import shutil
 import subprocess
 import sys
@@ -17,20 +18,19 @@ import sys
 
 def wrap_output(code: str, ns: Optional[str], with_include: bool) -> str:
     """Optionally wrap generated code with include, pragma once, and namespace."""
-    lines = ["#pragma once"]
-    if with_include:
-        lines.append("#include <tincup/tincup.hpp>")
-    lines.append("")
+    include = "#include <tincup/tincup.hpp>\n" if with_include else ""
     if ns:
-        lines.append(f"namespace {ns} {{")
-        lines.append("")
-        lines.append(code)
-        lines.append("")
-        lines.append(f"}} // namespace {ns}")
-        return "\n".join(lines)
-    else:
-        lines.append(code)
-        return "\n".join(lines)
+        return f"#pragma once\n{include}\nnamespace {ns} {{\n\n{code}\n\n}} // namespace {ns}"
+    return f"#pragma once\n{include}\n{code}"
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """Check the last byte of path without reading the rest of the file."""
+    with path.open("rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) in (b"\n", b"\r")
 
 
 def write_output(out_path, generated_code, append, format_code, clang_format_path):
@@ -39,9 +39,10 @@ def write_output(out_path, generated_code, append, format_code, clang_format_pat
         path = Path(out_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         if append and path.exists():
-            existing = path.read_text()
-            sep = "\n" if not existing.endswith("\n") else ""
-            path.write_text(existing + sep + generated_code)
+            # Append in place: O(len(generated_code)) rather than a full rewrite
+            sep = "" if _ends_with_newline(path) else "\n"
+            with path.open("a") as f:
+                f.write(sep + generated_code)
         else:
             path.write_text(generated_code)
 
@@ -0,0 +1,29 @@
+# TInCuP - A library for generating and validating C++ customization point objects that use `tag_invoke`
+#
+# Copyright (c) National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
+
+"""Fastest available JSON and YAML parsers, shared by the CLI and config loading."""
+
+import json
+
+try:
+    import orjson  # type: ignore
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    json_loads = orjson.loads
+except Exception:  # optional
+    json_loads = json.loads
+
+
+def yaml_loader():
+    """Return the libyaml-backed safe loader when PyYAML was built with it.
+
+    Falls back to the pure-Python SafeLoader. Raises ImportError if PyYAML
+    is not installed.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
@@ -9,6 +9,39 @@
 import re
 from jinja2 import Environment
 
+from .llm import detect_input_mode, process_llm_input
+
+# Qualifiers and pack ellipses are dropped by regex, reference/pointer marks by translate
+_STRIP_RE = re.compile(r"\bconst\b|\bvolatile\b|\.\.\.")
+_STRIP_TABLE = str.maketrans("", "", "&*")
+# A named pack spelled without '$' (e.g. 'Rest...')
+_BARE_PACK_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\s*\.\.\.")
+
+# Map return constraint names to C++ type traits
+_RETURN_CONSTRAINT_MAP = {
+    "returns_void_c": "std::is_void_v",
+    "returns_value_c": "!std::is_void_v",
+    "returns_new_object_c": "!std::is_void_v",
+}
+
+
+class ArgInfo:
+    """One parsed CPO argument as seen by the templates.
+
+    ``base`` (the generic name) is only set for '$' arguments, so templates
+    see it as undefined on concrete ones.
+    """
+
+    __slots__ = ("name", "full", "base", "is_variadic", "is_forwarding")
+
+    def __init__(self, name, full, is_variadic, is_forwarding=False, base=None):
+        self.name = name
+        self.full = full
+        self.is_variadic = is_variadic
+        self.is_forwarding = is_forwarding
+        if base is not None:
+            self.base = base
+
 
 def process_semantic_constraints(llm_metadata, cpo_name, concept_types):
     """Process semantic constraints from LLM metadata into C++ concepts."""
@@ -17,24 +50,18 @@ def process_semantic_constraints(llm_metadata, cpo_name, concept_types):
     
     constraints = []
     for constraint in llm_metadata["semantic_constraints"]:
-        # Replace template placeholders with actual values
-        processed_constraint = constraint.format(
-            cpo_name=cpo_name,
-            concept_types=concept_types
-        )
-        constraints.append(processed_constraint)
-    
-    # Map return constraint names to C++ type traits
-    return_constraint_map = {
-        "returns_void_c": "std::is_void_v",
-        "returns_value_c": "!std::is_void_v", 
-        "returns_new_object_c": "!std::is_void_v"
-    }
+        # Replace template placeholders with actual values; most constraints have none
+        if "{" in constraint or "}" in constraint:
+            constraint = constraint.format(
+                cpo_name=cpo_name,
+                concept_types=concept_types
+            )
+        constraints.append(constraint)
     
     return_constraint = None
     if "return_constraint" in llm_metadata:
         constraint_name = llm_metadata["return_constraint"]
-        return_constraint = return_constraint_map.get(constraint_name)
+        return_constraint = _RETURN_CONSTRAINT_MAP.get(constraint_name)
     
     return {
         "constraints": constraints,
@@ -46,15 +73,21 @@ def process_semantic_constraints(llm_metadata, cpo_name, concept_types):
 
 def parse_cpp_type(full_type):
     """Strips qualifiers to find the base template type name."""
-    base_type = re.sub(r"\bconst\b|\bvolatile\b", "", full_type)
-    base_type = base_type.replace("&", "").replace("*", "").replace("...", "")
-    return base_type.strip()
+    return _STRIP_RE.sub("", full_type).translate(_STRIP_TABLE).strip()
 
 
 def process_input(input_data, generate_doxygen_cli, template_env: Environment):
     """Processes the JSON input and returns generated code plus context for stubs."""
-    from .llm import detect_input_mode, process_llm_input
+    template_context, stub_ctx, with_doxygen = parse_input(input_data, generate_doxygen_cli)
+    return render_input(template_context, stub_ctx, with_doxygen, template_env), stub_ctx
+
+
+def parse_input(input_data, generate_doxygen_cli):
+    """Validate the JSON input and build its template context without rendering.
 
+    Returns (template context, context for stubs, whether to wrap in Doxygen).
+    Raises ValueError or KeyError for malformed specs.
+    """
     input_mode = detect_input_mode(input_data)
     is_llm_mode = input_mode == "LLM_MODE"
     if is_llm_mode:
@@ -109,50 +142,69 @@ def process_input(input_data, generate_doxygen_cli, template_env: Environment):
             }
 
     final_arg_pairs = raw_args
+    dispatch_arg_name = dispatch_info["dispatch_arg"] if dispatch_info else None
 
     parsed_args = []
-    generic_base_types = {"non_variadic": set(), "variadic": set()}
+    # Rendered pieces of each argument, collected in the same pass that parses them
+    pair_parts = []
+    name_parts = []
+    concept_parts = []
+    dispatch_idx = None
+    # Generic name -> whether it is a parameter pack
+    generic_base_types = {}
+    collisions = set()
     has_variadic = False
     for pair_str in final_arg_pairs:
         try:
-            full_type, name = [part.strip() for part in pair_str.rsplit(":", 1)]
+            head, sep, tail = pair_str.rpartition(":")
+            if not sep:
+                raise ValueError(pair_str)
+            full_type = head.strip()
+            name = tail.strip()
             # Detect a generic token anywhere in the type (e.g., 'const $Vs&...')
-            is_generic = ("$" in full_type)
+            dollar_idx = full_type.find("$")
+            is_generic = dollar_idx != -1
             is_variadic = "..." in full_type
             is_forwarding_ref = False
 
-            arg_data = {"name": name, "is_variadic": is_variadic}
-
             if is_generic:
                 # Extract the generic name starting at the first '$'
-                dollar_idx = full_type.find("$")
                 type_name = full_type[dollar_idx + 1:]
                 base_type = parse_cpp_type(type_name)
-                arg_data["base"] = base_type
 
-                if is_variadic:
-                    generic_base_types["variadic"].add(base_type)
-                else:
-                    generic_base_types["non_variadic"].add(base_type)
+                if generic_base_types.setdefault(base_type, is_variadic) != is_variadic:
+                    collisions.add(base_type)
 
                 if type_name.strip().endswith(("&&", "&&...")):
                     is_forwarding_ref = True
                     # Normalize forwarding ref to base&& (quals collapse at forwarding site)
-                    arg_data["full"] = base_type + "&&"
+                    full = base_type + "&&"
                 else:
                     # Remove '$Name' and '...' but preserve any qualifiers from full_type
-                    arg_data["full"] = full_type.replace("...", "").replace("$" + base_type, base_type)
+                    full = full_type.replace("...", "").replace("$" + base_type, base_type)
+                arg_data = ArgInfo(name, full, is_variadic, is_forwarding_ref, base_type)
             else:
                 # Disallow named packs without '$' (e.g., 'Rest...')
-                if is_variadic and re.search(r"[A-Za-z_][A-Za-z0-9_]*\s*\.\.\.", full_type):
+                if is_variadic and _BARE_PACK_RE.search(full_type):
                     raise ValueError(
                         f"Invalid variadic token in argument type '{full_type}': use '$Name...' to declare a pack"
                     )
-                arg_data["full"] = full_type.replace("...", "")
+                full = full_type.replace("...", "")
+                arg_data = ArgInfo(name, full, is_variadic)
 
-            arg_data["is_forwarding"] = is_forwarding_ref
             if is_variadic:
                 has_variadic = True
+
+            suffix = "..." if is_variadic else ""
+            pair_parts.append(f"{full}{suffix} {name}")
+            if is_forwarding_ref:
+                name_parts.append(f"std::forward<{base_type}>({name}){suffix}")
+                concept_parts.append(f"{base_type}{suffix}")
+            else:
+                name_parts.append(f"{name}{suffix}")
+                concept_parts.append(f"{full}{suffix}")
+            if dispatch_idx is None and name == dispatch_arg_name:
+                dispatch_idx = len(parsed_args)
             parsed_args.append(arg_data)
         except ValueError:
             raise ValueError(
@@ -160,9 +212,6 @@ def process_input(input_data, generate_doxygen_cli, template_env: Environment):
             )
 
     # Disallow using the same generic name as both a single type and a parameter pack
-    collisions = generic_base_types["non_variadic"].intersection(
-        generic_base_types["variadic"]
-    )
     if collisions:
         names = ", ".join(sorted(collisions))
         raise ValueError(
@@ -171,30 +220,13 @@ def process_input(input_data, generate_doxygen_cli, template_env: Environment):
             "Please use distinct names (e.g., use '$Vs...' for a pack and '$V' for a single)."
         )
 
-    concept_types_list = [
-        (arg["base"] if arg["is_forwarding"] else arg["full"]) for arg in parsed_args
-    ]
+    # Without runtime dispatch the lists are identical; otherwise drop the dispatch argument
+    concept_parts_no_dispatch = concept_parts
+    if dispatch_idx is not None:
+        concept_parts_no_dispatch = concept_parts[:dispatch_idx] + concept_parts[dispatch_idx + 1:]
 
-    concept_types_list_no_dispatch = []
-    dispatch_arg_name = dispatch_info["dispatch_arg"] if dispatch_info else None
-    for i, arg in enumerate(parsed_args):
-        if arg["name"] != dispatch_arg_name:
-            concept_types_list_no_dispatch.append(concept_types_list[i])
-
-    arg_pairs_str = ", ".join(
-        f"{arg['full']}{'...' if arg['is_variadic'] else ''} {arg['name']}"
-        for arg in parsed_args
-    )
-    arg_names_str = ", ".join(
-        [
-            (
-                f"std::forward<{arg['base']}>({arg['name']}){'...' if arg['is_variadic'] else ''}"
-                if arg["is_forwarding"]
-                else f"{arg['name']}{'...' if arg['is_variadic'] else ''}"
-            )
-            for arg in parsed_args
-        ]
-    )
+    arg_pairs_str = ", ".join(pair_parts)
+    arg_names_str = ", ".join(name_parts)
 
     arg_pairs_no_dispatch_str = arg_pairs_str
     arg_names_no_dispatch_str = arg_names_str
@@ -206,17 +238,15 @@ def process_input(input_data, generate_doxygen_cli, template_env: Environment):
         else:
             arg_pairs_str = dispatch_param
 
-    concept_types_str = ", ".join(
-        f"{t}{'...' if parsed_args[i]['is_variadic'] else ''}"
-        for i, t in enumerate(concept_types_list)
-    )
+    concept_types_str = ", ".join(concept_parts)
     
     # Create canonical concept argument string for consistency
     # This is the single source of truth for all tincup:: concept family uses
+    cpo_ftor = cpo_name + "_ftor"
     if concept_types_str:
-        canonical_concept_args = f"{cpo_name}_ftor, {concept_types_str}"
+        canonical_concept_args = cpo_ftor + ", " + concept_types_str
     else:
-        canonical_concept_args = f"{cpo_name}_ftor"
+        canonical_concept_args = cpo_ftor
     
     # Process semantic constraints for enhanced concepts
     semantic_info = process_semantic_constraints(llm_metadata, cpo_name, concept_types_str)
@@ -235,55 +265,55 @@ def process_input(input_data, generate_doxygen_cli, template_env: Environment):
         "dispatch_info": dispatch_info,
         "arg_pairs_no_dispatch": arg_pairs_no_dispatch_str,
         "arg_names_no_dispatch": arg_names_no_dispatch_str,
-        "concept_types_no_dispatch": ", ".join(
-            f"{t}{'...' if parsed_args[i]['is_variadic'] else ''}"
-            for i, t in enumerate(concept_types_list_no_dispatch)
-        ),
+        "concept_types_no_dispatch": ", ".join(concept_parts_no_dispatch),
     }
 
-    has_generics = bool(
-        generic_base_types["non_variadic"] or generic_base_types["variadic"]
-    )
+    has_generics = bool(generic_base_types)
+    arg_types_str = ""
     if has_generics:
-        sorted_non_variadic = sorted(list(generic_base_types["non_variadic"]))
-        sorted_variadic = [
-            f"typename... {t}" for t in sorted(list(generic_base_types["variadic"]))
-        ]
-        all_generics = [f"typename {t}" for t in sorted_non_variadic] + sorted_variadic
-        template_context["arg_types"] = ", ".join(all_generics)
+        # Single types first, then packs, each group alphabetical (one name needs no sort)
+        generics = generic_base_types.items()
+        if len(generic_base_types) > 1:
+            generics = sorted(generics, key=lambda item: (item[1], item[0]))
+        all_generics = [f"typename{'...' if is_pack else ''} {t}" for t, is_pack in generics]
+        arg_types_str = ", ".join(all_generics)
+        template_context["arg_types"] = arg_types_str
+
+    # Context for stub/trait emission, built from the locals already at hand
+    stub_ctx = {
+        "cpo_name": cpo_name,
+        "has_generics": has_generics,
+        "arg_pairs": arg_pairs_str,
+        "arg_types": arg_types_str,
+        "llm_metadata": llm_metadata,
+    }
+
+    return template_context, stub_ctx, bool(generate_doxygen or llm_metadata)
+
+
+def render_input(template_context, stub_ctx, with_doxygen, template_env: Environment):
+    """Render the CPO definition for a context built by parse_input."""
+    if stub_ctx["has_generics"]:
         cpo_template = template_env.get_template("generic_cpo.hpp.jinja2")
     else:
         cpo_template = template_env.get_template("concrete_cpo.hpp.jinja2")
 
     cpo_definition = cpo_template.render(template_context)
+    if not with_doxygen:
+        return cpo_definition
 
-    if generate_doxygen or llm_metadata:
-        doxygen_template = template_env.get_template("doxygen.jinja2")
-        template_context["cpo_definition"] = cpo_definition
-        template_context["param_docs"] = "\n".join(
-            [
-                f" * @param {arg['name']} [TODO: Description for {arg['name']}]"
-                for arg in parsed_args
-            ]
-        )
-        tag_invoke_sig = f"constexpr auto tag_invoke({cpo_name}_ftor, {template_context['arg_pairs']})"
-        if has_generics:
-            tag_invoke_sig = (
-                f"template<{template_context['arg_types']}>\n{tag_invoke_sig}"
-            )
-        template_context["tag_invoke_signature"] = tag_invoke_sig
-        return doxygen_template.render(template_context), {
-            "cpo_name": cpo_name,
-            "has_generics": has_generics,
-            "arg_pairs": template_context["arg_pairs"],
-            "arg_types": template_context.get("arg_types", ""),
-            "llm_metadata": llm_metadata,
-        }
-    else:
-        return cpo_definition, {
-            "cpo_name": cpo_name,
-            "has_generics": has_generics,
-            "arg_pairs": template_context["arg_pairs"],
-            "arg_types": template_context.get("arg_types", ""),
-            "llm_metadata": llm_metadata,
-        }
+    doxygen_template = template_env.get_template("doxygen.jinja2")
+    template_context["cpo_definition"] = cpo_definition
+    template_context["param_docs"] = "\n".join(
+        [
+            f" * @param {arg.name} [TODO: Description for {arg.name}]"
+            for arg in template_context["args"]
+        ]
+    )
+    tag_invoke_sig = (
+        "constexpr auto tag_invoke(" + stub_ctx["cpo_name"] + "_ftor, " + stub_ctx["arg_pairs"] + ")"
+    )
+    if stub_ctx["has_generics"]:
+        tag_invoke_sig = "template<" + stub_ctx["arg_types"] + ">\n" + tag_invoke_sig
+    template_context["tag_invoke_signature"] = tag_invoke_sig
+    return doxygen_template.render(template_context)
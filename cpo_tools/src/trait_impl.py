@@ -7,9 +7,24 @@
 # Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
 
 from jinja2 import Environment
+import functools
 import re
 
 
+_ANGLE_RE = re.compile(r"<(.+?)>")
+# Classifies one impl-target token in a single match; alternatives are tried in order
+_TOKEN_RE = re.compile(
+    r"\$(?P<name>[A-Za-z_][A-Za-z0-9_]*)(?P<pack>\.\.\.)?"  # $Name or $Name...
+    r"|\$(?P<raw>.*)"  # '$' not followed by an identifier: kept verbatim without '$'
+    r"|(?P<anon>\.\.\.)"  # anonymous pack
+    r"|(?P<bare_pack>[A-Za-z_][A-Za-z0-9_]*\s*\.\.\.)"  # Name... without '$'
+    r"|(?P<concrete>.+)",
+    re.DOTALL,
+)
+
+
+# Pure function of the target string; trait and shim emission often share targets
+@functools.lru_cache(maxsize=256)
 def _analyze_target(target: str):
     """Parse target type string for generics and packs.
     Returns (template_params, specialized_target).
@@ -24,7 +39,7 @@ def _analyze_target(target: str):
     accidentally turning concrete types like 'double' into template parameters.
     """
     s = target.strip()
-    m = re.search(r"<(.+?)>", s)
+    m = _ANGLE_RE.search(s)
     if not m:
         # No angle-bracket args; still allow anonymous '...'
         if '...' in s:
@@ -45,47 +60,36 @@ def _analyze_target(target: str):
     for tok in tokens:
         if tok == '':
             continue
+        m_tok = _TOKEN_RE.fullmatch(tok)
+        kind = m_tok.lastgroup
+        # Named generics require '$' prefix
+        if kind in ('name', 'pack'):
+            name = m_tok.group('name')
+            is_pack = kind == 'pack'
+            add_param(name, is_pack)
+            new_parts.append(f"{name}..." if is_pack else name)
+        elif kind == 'raw':
+            # Fallback: treat as concrete if not an identifier
+            new_parts.append(m_tok.group('raw'))
         # Anonymous pack
-        if tok == '...':
+        elif kind == 'anon':
             add_param('P', True)
             new_parts.append('P...')
-            continue
-        # Named generics require '$' prefix
-        if tok.startswith('$'):
-            base = tok[1:]
-            if base.endswith('...'):
-                name = base[:-3]
-                if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
-                    # Fallback: treat as concrete if not an identifier
-                    new_parts.append(base)
-                else:
-                    add_param(name, True)
-                    new_parts.append(f"{name}...")
-            else:
-                name = base
-                if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
-                    new_parts.append(base)
-                else:
-                    add_param(name, False)
-                    new_parts.append(name)
-            continue
         # Named pack without '$' is ambiguous; force explicit '$'
-        if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*\s*\.\.\.", tok):
+        elif kind == 'bare_pack':
             raise ValueError(
                 f"Invalid impl-target token '{tok}': use '${tok}' to declare a template parameter pack"
             )
         # Otherwise, treat as concrete token (could be nested or builtin)
-        new_parts.append(tok)
+        else:
+            new_parts.append(tok)
 
     tmpl = ''
     if template_params:
         tmpl = 'template<' + ', '.join(template_params) + '>'
 
-    # Rebuild with rewritten angle content
-    def _sub_once(match):
-        return '<' + ', '.join(new_parts) + '>'
-
-    specialized = re.sub(r"<(.+?)>", _sub_once, s, count=1)
+    # Rebuild with rewritten angle content, splicing at the span found above
+    specialized = s[:m.start()] + '<' + ', '.join(new_parts) + '>' + s[m.end():]
     return tmpl, specialized
 
 
@@ -12,8 +12,9 @@ import os
 import sys
 import re
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 
 # Default banner text embedded from BANNER.txt
 BANNER_TEXT = (
@@ -24,6 +25,20 @@ BANNER_TEXT = (
     "Questions? Contact Greg von Winckel (gvonwin@sandia.gov)\n"
 )
 
+# Banners sit at the top of a file, so only a prefix is read: the longest banner
+# rendering plus this many characters for a shebang line and surrounding whitespace
+BANNER_READ_SLACK = 4096
+
+# A warm-cache banner check takes ~10 us per file, so threads only help when reads
+# block on cold storage; below this many files the whole check is under a millisecond
+PARALLEL_MIN_FILES = 64
+
+def _compile_globs(patterns: List[str]) -> re.Pattern:
+    """Union glob patterns into one anchored regex (never matches when empty)."""
+    # fnmatch.translate() ends each pattern with \Z; anchor the union once instead
+    body = "|".join(f"(?:{fnmatch.translate(p)[:-2]})" for p in patterns)
+    return re.compile(rf"(?:{body})\Z" if body else r"(?!)")
+
 class BannerChecker:
     """
     This script recursively checks all C++ (.hpp, .cpp), Python (.py),
@@ -34,11 +49,21 @@ class BannerChecker:
     def __init__(self, banner_file: Optional[str] = None, banner_text: Optional[str] = None):
         self.banner_file = banner_file
         self.banner_text = self._load_banner(banner_file, banner_text)
+        # Banner renderings are fixed for the checker's lifetime; build them once
+        self._commented_banner_str = "\n".join(
+            f"# {line}".rstrip() if line.strip() else "#" for line in self.banner_text.split('\n')
+        )
+        self._cpp_block_str = f"/**\n{self.banner_text}\n*/\n\n"
+        self._read_size = (
+            max(len(self._cpp_block_str), len(self._commented_banner_str)) + BANNER_READ_SLACK
+        )
         self.cpp_extensions = {'.hpp', '.cpp'}
         self.python_extensions = {'.py'}
         self.cmake_files = {'CMakeLists.txt'}
         self.cmake_extensions = {'.cmake'}
         self.gitignore_patterns = self._load_gitignore()
+        # Ignore status of directories relative to the scan root
+        self._dir_ignore_cache: Dict[Path, bool] = {}
         
     def _load_banner(self, banner_file: Optional[str], banner_text: Optional[str]) -> str:
         """Resolve banner text from explicit value, file, or built-in default."""
@@ -55,7 +80,7 @@ class BannerChecker:
         return BANNER_TEXT.strip()
     
     def _load_gitignore(self) -> List[str]:
-        """Load patterns from .gitignore file if it exists."""
+        """Load patterns from .gitignore file if it exists and precompile them."""
         gitignore_path = Path(".gitignore")
         patterns = []
         if gitignore_path.exists():
@@ -67,6 +92,11 @@ class BannerChecker:
                             patterns.append(line)
             except Exception as e:
                 print(f"Warning: Error reading .gitignore: {e}")
+        # Directory patterns (ending with /) match any path component; other
+        # patterns match the relative path, the file name, or any component.
+        file_patterns = [p for p in patterns if not p.endswith('/')]
+        self._path_re = _compile_globs(file_patterns)
+        self._part_re = _compile_globs([p[:-1] if p.endswith('/') else p for p in patterns])
         return patterns
     
     def _is_ignored(self, file_path: Path, root_dir: Path) -> bool:
@@ -78,44 +108,47 @@ class BannerChecker:
             # Path is not relative to root_dir, don't ignore
             return False
         
-        path_str = str(relative_path)
-        path_parts = relative_path.parts
-        
-        for pattern in self.gitignore_patterns:
-            # Handle directory patterns (ending with /)
-            if pattern.endswith('/'):
-                dir_pattern = pattern[:-1]
-                if any(fnmatch.fnmatch(part, dir_pattern) for part in path_parts):
-                    return True
-            # Handle file patterns
-            elif fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True
-            # Handle patterns that match directory components
-            elif any(fnmatch.fnmatch(part, pattern) for part in path_parts):
-                return True
-        
-        return False
-    
-    def _get_cpp_banner_pattern(self) -> str:
-        """Generate the expected C++ banner pattern"""
-        escaped_banner = re.escape(self.banner_text)
-        # Allow for whitespace variations in the comment block
-        return rf'/\*\*\s*{escaped_banner}\s*\*/'
+        if self._path_re.match(str(relative_path)):
+            return True
+        if self._part_re.match(relative_path.name):
+            return True
+        return self._is_ignored_parent(relative_path.parent)
+
+    def _is_ignored_parent(self, relative_dir: Path) -> bool:
+        """Check (and memoize) whether any component of a relative directory is ignored."""
+        cached = self._dir_ignore_cache.get(relative_dir)
+        if cached is None:
+            if not relative_dir.name:
+                cached = False
+            else:
+                cached = (self._part_re.match(relative_dir.name) is not None
+                          or self._is_ignored_parent(relative_dir.parent))
+            self._dir_ignore_cache[relative_dir] = cached
+        return cached
+
+    def _is_ignored_dir(self, name: str) -> bool:
+        """Check if a directory name matches a .gitignore pattern (its whole subtree is ignored)."""
+        return self._part_re.match(name) is not None
     
     def _commented_banner(self) -> str:
         """Return the banner commented with leading '#' per line (for Python/CMake)."""
-        banner_lines = self.banner_text.split('\n')
-        commented_lines = [f"# {line}".rstrip() if line.strip() else "#" for line in banner_lines]
-        return "\n".join(commented_lines)
+        return self._commented_banner_str
     
     def _check_cpp_file(self, file_path: Path) -> bool:
         """Check if a C++ file has the proper banner"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = f.read(self._read_size)
             
-            pattern = self._get_cpp_banner_pattern()
-            return bool(re.search(pattern, content, re.DOTALL))
+            # The banner must open the file: "/**", banner text, "*/", with
+            # any whitespace around the banner text
+            content = content.lstrip()
+            if not content.startswith('/**'):
+                return False
+            body = content[3:].lstrip()
+            if not body.startswith(self.banner_text):
+                return False
+            return body[len(self.banner_text):].lstrip().startswith('*/')
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
             return False
@@ -124,7 +157,7 @@ class BannerChecker:
         """Check if a Python/CMake file has the proper banner"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = f.read(self._read_size)
             
             # For Python files, skip shebang line if present and any immediate blank lines after it
             lines = content.split('\n')
@@ -136,8 +169,7 @@ class BannerChecker:
             
             # Check if banner appears at the start (after potential shebang)
             content_to_check = '\n'.join(lines[start_index:])
-            commented_banner = self._commented_banner()
-            return content_to_check.startswith(commented_banner)
+            return content_to_check.startswith(self._commented_banner_str)
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
             return False
@@ -173,6 +205,26 @@ class BannerChecker:
               file_path.name in self.cmake_files):
             return self._check_python_file(file_path)
         return True  # Skip files we don't check
+
+    def _scan(self, path: str):
+        """Yield candidate files below path, pruning ignored directories before descending.
+
+        Unreadable directories are skipped. Symlinked files are checked, but
+        symlinked directories are not descended into.
+        """
+        try:
+            it = os.scandir(path)
+        except OSError:
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not self._is_ignored_dir(entry.name):
+                        yield from self._scan(entry.path)
+                elif entry.is_file():
+                    file_path = Path(entry.path)
+                    if self._should_check_file(file_path):
+                        yield file_path
     
     def scan_directory(self, root_dir: str = ".") -> Tuple[List[Path], List[Path]]:
         """Recursively scan directory and return lists of compliant and non-compliant files"""
@@ -181,27 +233,35 @@ class BannerChecker:
         
         root_path = Path(root_dir)
         
-        for file_path in root_path.rglob("*"):
-            if (file_path.is_file() and 
-                self._should_check_file(file_path) and 
-                not self._is_ignored(file_path, root_path)):
-                if self.check_file(file_path):
-                    compliant_files.append(file_path)
-                else:
-                    non_compliant_files.append(file_path)
+        candidates = [p for p in self._scan(root_dir) if not self._is_ignored(p, root_path)]
+        if len(candidates) < PARALLEL_MIN_FILES:
+            results = [self.check_file(p) for p in candidates]
+        else:
+            # File reads are I/O bound and release the GIL; map keeps input order
+            with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as ex:
+                results = list(ex.map(self.check_file, candidates))
+        for file_path, ok in zip(candidates, results):
+            if ok:
+                compliant_files.append(file_path)
+            else:
+                non_compliant_files.append(file_path)
         
         return compliant_files, non_compliant_files
 
     # --- Fixers ---
     def _cpp_banner_block(self) -> str:
-        return f"/**\n{self.banner_text}\n*/\n\n"
+        return self._cpp_block_str
 
     def _python_cmake_banner_block(self) -> str:
-        return self._commented_banner() + "\n\n"
+        return self._commented_banner_str + "\n\n"
+
+    def fix_file(self, file_path: Path, already_checked: bool = False) -> bool:
+        """Insert the appropriate banner into the file if missing. Returns True if modified.
 
-    def fix_file(self, file_path: Path) -> bool:
-        """Insert the appropriate banner into the file if missing. Returns True if modified."""
-        if self.check_file(file_path):
+        Pass already_checked=True when the file is known to be non-compliant
+        (e.g. from scan_directory) to skip re-reading it for the check.
+        """
+        if not already_checked and self.check_file(file_path):
             return False
         try:
             text = file_path.read_text(encoding='utf-8')
@@ -301,8 +361,9 @@ def main():
     if args.fix and non_compliant_files:
         print(f"Attempting to fix {len(non_compliant_files)} non-compliant files by inserting banners...\n")
         fixed = 0
-        for file_path in sorted(non_compliant_files):
-            if checker.fix_file(file_path):
+        # key=os.fspath stringifies each path once instead of comparing Path objects
+        for file_path in sorted(non_compliant_files, key=os.fspath):
+            if checker.fix_file(file_path, already_checked=True):
                 print(f"  + Fixed: {file_path}")
                 fixed += 1
             else:
@@ -314,14 +375,14 @@ def main():
     
     if args.verbose:
         print("Compliant files:")
-        for file_path in sorted(compliant_files):
+        for file_path in sorted(compliant_files, key=os.fspath):
             file_type = checker._get_file_type(file_path)
             print(f"  ✓ {file_path} ({file_type})")
         print()
     
     if non_compliant_files:
         print("Non-compliant files:")
-        for file_path in sorted(non_compliant_files):
+        for file_path in sorted(non_compliant_files, key=os.fspath):
             file_type = checker._get_file_type(file_path)
             print(f"  ✗ {file_path} ({file_type})")
         print()
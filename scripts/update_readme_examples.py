@@ -25,13 +25,36 @@ Recommended alternative:
 """
 
 import argparse
+import contextlib
+import importlib.util
+import io
 import json
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 import re
 
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Call the generator in-process when importable; otherwise shell out per example
+sys.path.insert(0, str(PROJECT_ROOT))
+try:
+    from cpo_tools.cpo_generator import main as gen_main
+except ImportError:
+    gen_main = None
+
+# "### Examples" header line
+_EXAMPLES_HDR_RE = re.compile(r'^### Examples\s*$', re.MULTILINE)
+# Next major section (## or ###) or end of file, avoiding "### Examples" itself
+_NEXT_SECTION_RE = re.compile(r'\n## [^#]|\n### [^E]|\Z', re.MULTILINE)
+
+# redirect_stdout and chdir change process-wide state, so in-process runs take turns
+_GEN_LOCK = threading.Lock()
+
 
 def load_examples_config(config_path: Path) -> Dict[str, Any]:
     """Load examples configuration from JSON file."""
@@ -48,6 +71,8 @@ def load_examples_config(config_path: Path) -> Dict[str, Any]:
 
 def run_cpo_generator(command_args: List[str]) -> str:
     """Run the CPO generator with the given arguments and return the output."""
+    if gen_main is not None:
+        return _run_cpo_generator_in_process(command_args)
     try:
         full_cmd = ['python3', '-m', 'cpo_tools.cpo_generator'] + command_args
         
@@ -55,7 +80,7 @@ def run_cpo_generator(command_args: List[str]) -> str:
             full_cmd,
             capture_output=True,
             text=True,
-            cwd=Path(__file__).parent.parent  # Run from project root
+            cwd=PROJECT_ROOT  # Run from project root
         )
         
         if result.returncode != 0:
@@ -67,12 +92,32 @@ def run_cpo_generator(command_args: List[str]) -> str:
         raise RuntimeError(f"Failed to run cpo-generator: {e}")
 
 
+def _run_cpo_generator_in_process(command_args: List[str]) -> str:
+    """Call cpo_generator.main directly from the project root, capturing what it prints."""
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with _GEN_LOCK, contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            cwd = os.getcwd()
+            os.chdir(PROJECT_ROOT)  # Match the subprocess fallback's working directory
+            try:
+                gen_main(command_args)
+            finally:
+                os.chdir(cwd)
+    except SystemExit as e:
+        if e.code:
+            raise RuntimeError(f"Command failed: cpo-generator {' '.join(command_args)}\nStderr: {err.getvalue()}")
+    except Exception as e:
+        raise RuntimeError(f"Failed to run cpo-generator: {e}")
+    return out.getvalue().strip()
+
+
 def generate_example_section(example: Dict[str, Any]) -> str:
     """Generate a collapsible markdown section for a single example."""
     name = example['name']
     description = example.get('description', '')
     command_args = example['command_args']
     usage_examples = example.get('usage_examples', [])
+    print(f"Generating example: {name}")
     
     # Generate the command string for display
     command_display = 'cpo-generator ' + ' '.join(command_args)
@@ -120,21 +165,30 @@ def generate_examples_section(config: Dict[str, Any]) -> str:
     template = config.get('template', {})
     header = template.get('section_header', '### Examples\n\n')
     footer = template.get('section_footer', '')
-    
+
     examples = sorted(config['examples'], key=lambda x: x.get('order', 0))
-    
-    sections = [header]
-    
-    for example in examples:
-        print(f"Generating example: {example['name']}")
-        section = generate_example_section(example)
-        sections.append(section)
-        sections.append('')  # Add spacing between sections
-    
+
+    buf = io.StringIO()
+    buf.write(header)
+
+    if gen_main is not None:
+        # In-process runs are serialized by _GEN_LOCK anyway, so a pool would add nothing
+        sections = [generate_example_section(example) for example in examples]
+    else:
+        # Each example spawns its own process; run them concurrently in the sorted order
+        with ThreadPoolExecutor() as ex:
+            sections = list(ex.map(generate_example_section, examples))
+
+    for section in sections:
+        buf.write('\n')
+        buf.write(section)
+        buf.write('\n')  # Blank line between sections
+
     if footer:
-        sections.append(footer)
-    
-    return '\n'.join(sections)
+        buf.write('\n')
+        buf.write(footer)
+
+    return buf.getvalue()
 
 
 def find_examples_section(readme_content: str) -> tuple[int, int]:
@@ -143,8 +197,7 @@ def find_examples_section(readme_content: str) -> tuple[int, int]:
     Returns (start_pos, end_pos) or (-1, -1) if not found.
     """
     # Look for the Examples header
-    examples_pattern = r'^### Examples\s*$'
-    match = re.search(examples_pattern, readme_content, re.MULTILINE)
+    match = _EXAMPLES_HDR_RE.search(readme_content)
     
     if not match:
         print("WARNING: Could not find '### Examples' section in README")
@@ -153,11 +206,10 @@ def find_examples_section(readme_content: str) -> tuple[int, int]:
     start_pos = match.start()
     
     # Find the next major section (## or ###) or end of file
-    next_section_pattern = r'\n## [^#]|\n### [^E]|\Z'  # Avoid matching "### Examples" again
-    next_match = re.search(next_section_pattern, readme_content[start_pos + 1:], re.MULTILINE)
+    next_match = _NEXT_SECTION_RE.search(readme_content, start_pos + 1)
     
     if next_match:
-        end_pos = start_pos + 1 + next_match.start()
+        end_pos = next_match.start()
     else:
         end_pos = len(readme_content)
     
@@ -264,15 +316,9 @@ def main():
         sys.exit(1)
     
     # Check if we can find the cpo_generator
-    try:
-        result = subprocess.run(['python3', '-m', 'cpo_tools.cpo_generator', '--help'], 
-                              capture_output=True, cwd=Path(__file__).parent.parent)
-        if result.returncode != 0:
-            print("ERROR: Could not find cpo_tools.cpo_generator module")
-            print("Make sure you're running from the project root and the module is installed")
-            sys.exit(1)
-    except Exception as e:
-        print(f"ERROR: Could not test cpo_generator: {e}")
+    if importlib.util.find_spec('cpo_tools.cpo_generator') is None:
+        print("ERROR: Could not find cpo_tools.cpo_generator module")
+        print("Make sure you're running from the project root and the module is installed")
         sys.exit(1)
     
     # Update examples
@@ -24,6 +24,12 @@ REPO_ROOT = Path(__file__).parent.parent
 README = REPO_ROOT / "README.md"
 VERSION_FILE = REPO_ROOT / "VERSION"
 
+# One pass over the README for both fixes:
+# 1) Normal case: TInCuP==<ver>
+# 2) Cleanup for a previous bad replacement that left a literal "\\g<1>" in
+#    commands, e.g. "pip install \\g<1>1.2.3" (group 1 keeps the pip prefix)
+_VERSION_RE = re.compile(r"TInCuP==\d+\.\d+\.\d+|(pip(?:x)? install )\\g<1>\d+\.\d+\.\d+")
+
 
 def main() -> int:
     if not VERSION_FILE.exists():
@@ -40,15 +46,7 @@ def main() -> int:
 
     content = README.read_text(encoding="utf-8")
 
-    # Apply multiple fixes in order:
-    # 1) Normal case: replace TInCuP==<ver> with TInCuP=={version}
-    pattern1 = re.compile(r"(TInCuP==)(\d+\.\d+\.\d+)")
-    new_content = pattern1.sub(lambda m: f"{m.group(1)}{version}", content)
-
-    # 2) Cleanup for previous bad replacement that left literal "\\g<1>" in commands
-    #    e.g., "pip install \\g<1>1.2.3" -> "pip install TInCuP=={version}"
-    pattern2 = re.compile(r"(pip(?:x)? install )\\g<1>\d+\.\d+\.\d+")
-    new_content = pattern2.sub(lambda m: f"{m.group(1)}TInCuP=={version}", new_content)
+    new_content = _VERSION_RE.sub(lambda m: f"{m.group(1) or ''}TInCuP=={version}", content)
 
     # If nothing changed, be explicit
     if new_content == content:
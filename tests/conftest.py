@@ -0,0 +1,68 @@
+# TInCuP - A library for generating and validating C++ customization point objects that use `tag_invoke`
+#
+# Copyright (c) National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
+
+
+import os
+import shutil
+import subprocess
+import pytest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def pytest_configure(config):
+    """Export the project root so test modules (and xdist workers) skip rediscovering it.
+
+    Always overwritten: a TINCUP_ROOT exported for another checkout must not
+    point the tests at that tree's headers.
+    """
+    os.environ["TINCUP_ROOT"] = str(PROJECT_ROOT)
+
+
+@pytest.fixture(scope="session")
+def cxx():
+    """
+    Compiler command prefix for the diagnostic tests: g++, run through ccache when
+    it is installed. ccache compiles -fsyntax-only and multi-file runs directly,
+    uncached, so in practice it caches the precompiled header build across runs.
+    """
+    ccache = shutil.which("ccache")
+    return [ccache, "g++"] if ccache else ["g++"]
+
+
+@pytest.fixture(scope="session")
+def tincup_pch(tmp_path_factory, cxx):
+    """
+    Builds a precompiled header for the tincup include tree and yields the path of
+    the umbrella header, so each diagnostic file loads the PCH instead of re-parsing
+    the headers.
+
+    Safe under pytest-xdist: session fixtures run once per worker, and each worker
+    builds into its own directory (PYTEST_XDIST_WORKER is set by xdist), so no two
+    workers ever write the same .gch.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    header = tmp_path_factory.mktemp(f"tincup_pch_{worker}") / "tincup_all.hpp"
+    header.write_text('#include "single_include/tincup.hpp"\n')
+    gch = header.with_name(header.name + ".gch")
+    # Must match the flags used for the test files, or g++ ignores the PCH and
+    # falls back to the plain header (still correct, just slower)
+    # ccache only caches precompiled header builds with this sloppiness set
+    env = dict(os.environ)
+    env["CCACHE_SLOPPINESS"] = ",".join(
+        filter(None, [env.get("CCACHE_SLOPPINESS"), "pch_defines", "time_macros"])
+    )
+    subprocess.run(
+        [*cxx, "-std=c++20", f"-I{PROJECT_ROOT}", "-x", "c++-header", str(header), "-o", str(gch)],
+        capture_output=True,
+        env=env,
+    )
+    yield header
+    # The PCH is tens of MB; don't leave it in pytest's retained tmp dirs
+    gch.unlink(missing_ok=True)
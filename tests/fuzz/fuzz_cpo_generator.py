@@ -11,7 +11,6 @@
 # Exercises JSON spec parsing + template generation to uncover unexpected exceptions.
 
 import sys
-import json
 
 try:
     import atheris  # type: ignore
@@ -20,29 +19,34 @@ except Exception:  # pragma: no cover - atheris only in CI fuzz job
 
 from jinja2 import Environment, PackageLoader
 
+from cpo_tools.src.parsers import json_loads as _json_loads
 from cpo_tools.src.process import process_input
 
+# Shared across iterations so templates are loaded and compiled only once
+_ENV = Environment(
+    loader=PackageLoader("cpo_tools", "templates"),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
 
 def _process(spec: dict) -> None:
     """Try to process a fuzzed spec through the generator pipeline."""
-    env = Environment(
-        loader=PackageLoader("cpo_tools", "templates"),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
     # We expect ValueError/KeyError/TypeError for malformed inputs; those are fine.
     try:
-        process_input(spec, doxygen=False, template_env=env)
+        process_input(spec, doxygen=False, template_env=_ENV)
     except (ValueError, KeyError, TypeError):
         return
 
 
 def TestOneInput(data: bytes) -> None:  # libFuzzer entrypoint
+    # Only JSON objects are useful specs; skip the parse for anything else
+    if data.lstrip(b" \t\n\r")[:1] != b"{":
+        return
     try:
-        # Decode fuzz bytes to a string and attempt JSON parsing
-        s = data.decode("utf-8", "ignore")
-        obj = json.loads(s)
-    except json.JSONDecodeError:
+        # Both parsers take bytes directly; invalid UTF-8 is rejected as ValueError
+        obj = _json_loads(data)
+    except ValueError:
         return
     # We only care about dict-like specs
     if not isinstance(obj, dict):
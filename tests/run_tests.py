@@ -16,17 +16,60 @@ Usage:
     python run_tests.py --verification     # Run only verification tests
     python run_tests.py --verbose          # Verbose output
     python run_tests.py --coverage         # Run with coverage (if available)
+    python run_tests.py --jobs 4           # Run test classes on 4 workers (default: serial)
 """
 
 import sys
 import os
+import io
 import argparse
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
 # Add cpo_tools to path for imports  
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../cpo_tools'))
 
+def _iter_tests(suite):
+    """Yield the individual test cases of a (nested) suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _run_test_ids(test_ids, verbosity):
+    """Run the named tests in a worker process and return a picklable summary."""
+    stream = io.StringIO()
+    suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+    result = unittest.TextTestRunner(
+        stream=stream, verbosity=verbosity, buffer=True, failfast=False
+    ).run(suite)
+    return result.testsRun, result.wasSuccessful(), stream.getvalue()
+
+
+def _run_parallel(suite, verbosity, jobs):
+    """Run each TestCase class in its own worker; returns True if all passed."""
+    # Keep a class's tests together so setUpClass/tearDownClass run once per class
+    groups = {}
+    for test in _iter_tests(suite):
+        groups.setdefault(type(test), []).append(test.id())
+    ok = True
+    total = 0
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futures = [ex.submit(_run_test_ids, ids, verbosity) for ids in groups.values()]
+        # Report in suite order regardless of completion order
+        for future in futures:
+            tests_run, passed, output = future.result()
+            sys.stderr.write(output)
+            total += tests_run
+            ok = ok and passed
+    print(f"\nRan {total} tests in {len(groups)} groups: {'OK' if ok else 'FAILED'}",
+          file=sys.stderr)
+    return ok
+
+
 def main():
     parser = argparse.ArgumentParser(description='Run CPO pattern verification tests')
     parser.add_argument('--pattern', action='store_true', 
@@ -37,6 +80,9 @@ def main():
                        help='Verbose test output')
     parser.add_argument('--coverage', action='store_true',
                        help='Run with coverage reporting')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Worker processes for running test classes in parallel '
+                            '(default: 1; coverage always runs serially)')
     
     args = parser.parse_args()
     
@@ -58,6 +104,9 @@ def main():
     
     # Run tests with coverage if requested
     if args.coverage:
+        # Prefer the C tracer (much cheaper per traced line than the Python
+        # one); an explicit COVERAGE_CORE from the environment still wins
+        os.environ.setdefault('COVERAGE_CORE', 'ctrace')
         try:
             import coverage
             cov = coverage.Coverage()
@@ -75,6 +124,8 @@ def main():
             print("Coverage module not available. Install with: pip install coverage", 
                   file=sys.stderr)
             return 1
+    elif args.jobs > 1:
+        return 0 if _run_parallel(suite, verbosity, args.jobs) else 1
     else:
         result = runner.run(suite)
     
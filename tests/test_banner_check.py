@@ -0,0 +1,98 @@
+# TInCuP - A library for generating and validating C++ customization point objects that use `tag_invoke`
+#
+# Copyright (c) National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
+
+"""Tests for the copyright banner checker in scripts/banner_check.py."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import banner_check
+from banner_check import BannerChecker
+
+
+class LongBannerTests(unittest.TestCase):
+    """Banners longer than the read slack must still be recognized."""
+
+    banner_text = "\n".join(f"Line {i} of a long license header." for i in range(200))
+
+    def setUp(self):
+        self.assertGreater(len(self.banner_text), 4096)
+        self.checker = BannerChecker(banner_text=self.banner_text)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _write(self, name: str, text: str) -> Path:
+        path = Path(self.tmp.name) / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_cpp_banner_compliant(self):
+        path = self._write("a.hpp", self.checker._cpp_banner_block() + "int x;\n")
+        self.assertTrue(self.checker.check_file(path))
+
+    def test_python_banner_compliant_after_shebang(self):
+        text = "#!/usr/bin/env python3\n" + self.checker._python_cmake_banner_block() + "x = 1\n"
+        path = self._write("a.py", text)
+        self.assertTrue(self.checker.check_file(path))
+
+    def test_fix_does_not_duplicate_banner(self):
+        path = self._write("CMakeLists.txt", "project(x)\n")
+        self.assertTrue(self.checker.fix_file(path))
+        fixed = path.read_text(encoding="utf-8")
+        self.assertFalse(self.checker.fix_file(path))
+        self.assertEqual(path.read_text(encoding="utf-8"), fixed)
+
+
+class ScanDirectoryTests(unittest.TestCase):
+    """Tests for the directory walk behind scan_directory."""
+
+    def setUp(self):
+        self.checker = BannerChecker()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        (self.root / "a.hpp").write_text("int a;\n", encoding="utf-8")
+
+    def _scanned(self):
+        compliant, non_compliant = self.checker.scan_directory(str(self.root))
+        return sorted(p.name for p in compliant + non_compliant)
+
+    def test_unreadable_directory_skipped(self):
+        """A directory that cannot be listed is skipped rather than aborting the scan."""
+        locked = self.root / "locked"
+        locked.mkdir()
+        (locked / "b.hpp").write_text("int b;\n", encoding="utf-8")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if Path(path) == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with mock.patch.object(banner_check.os, "scandir", scandir):
+            self.assertEqual(self._scanned(), ["a.hpp"])
+
+    def test_symlinked_file_checked_but_not_symlinked_dir(self):
+        """Symlinked files are checked; symlinked directories are not descended into."""
+        outside = tempfile.TemporaryDirectory()
+        self.addCleanup(outside.cleanup)
+        target = Path(outside.name)
+        (target / "c.hpp").write_text("int c;\n", encoding="utf-8")
+        os.symlink(target / "c.hpp", self.root / "link.hpp")
+        os.symlink(target, self.root / "linked_dir")
+        self.assertEqual(self._scanned(), ["a.hpp", "link.hpp"])
+
+
+if __name__ == "__main__":
+    unittest.main()
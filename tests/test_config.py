@@ -0,0 +1,68 @@
+# TInCuP - A library for generating and validating C++ customization point objects that use `tag_invoke`
+#
+# Copyright (c) National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
+
+"""Tests for configuration loading in cpo_tools/config.py."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cpo_tools.config import load_config
+
+
+class LoadConfigTests(unittest.TestCase):
+    """Tests for load_config's file handling and precedence."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.home = Path(tmp.name) / "home"
+        self.project = Path(tmp.name) / "project"
+        (self.home / ".cpo-tools").mkdir(parents=True)
+        self.project.mkdir()
+        cwd = os.getcwd()
+        os.chdir(self.project)
+        self.addCleanup(os.chdir, cwd)
+        patcher = mock.patch.object(Path, "home", return_value=self.home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_project(self, text: str) -> Path:
+        path = self.project / ".cpo-tools.yaml"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def test_missing_files_give_defaults(self):
+        self.assertEqual(load_config()["style"]["indent"], 2)
+
+    def test_project_overrides_user(self):
+        (self.home / ".cpo-tools" / "config.yaml").write_text("style: {indent: 4}\n")
+        self._write_project("style: {indent: 8}\n")
+        self.assertEqual(load_config()["style"], {"indent": 8})
+
+    def test_file_with_zero_mtime_loaded(self):
+        """Configs stamped with SOURCE_DATE_EPOCH=0 are still read."""
+        path = self._write_project("style: {indent: 7}\n")
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(load_config()["style"], {"indent": 7})
+
+    def test_changes_seen_on_next_call(self):
+        self._write_project("style: {indent: 3}\n")
+        self.assertEqual(load_config()["style"], {"indent": 3})
+        self._write_project("style: {indent: 5}\n")
+        self.assertEqual(load_config()["style"], {"indent": 5})
+
+    def test_caller_mutations_do_not_leak(self):
+        load_config()["verification"]["allowed_deviations"].append("x")
+        self.assertEqual(load_config()["verification"]["allowed_deviations"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+# TInCuP - A library for generating and validating C++ customization point objects that use `tag_invoke`
+#
+# Copyright (c) National Technology & Engineering Solutions of Sandia,
+# LLC (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+# Government retains certain rights in this software.
+#
+# Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
+
+"""Tests for the CPO registry scanner in cpo_tools/cpo_registry.py."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from cpo_tools.cpo_registry import scan_file
+
+
+class ScanFileTests(unittest.TestCase):
+    """Tests for associating CPO tags with their structs."""
+
+    def _scan(self, text: str):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "cpos.hpp"
+            path.write_text(text, encoding="utf-8")
+            return scan_file(path)
+
+    def test_one_line_cpo_binds_its_own_struct(self):
+        """A tag before the struct on the same line belongs to that struct, not the previous one."""
+        entries = self._scan(
+            'struct w_ftor final : cpo_base<w_ftor> { TINCUP_CPO_TAG("w") };\n'
+            'TINCUP_CPO_TAG("x") struct x_ftor final : cpo_base<x_ftor> {}; inline constexpr x_ftor x{};\n'
+        )
+        self.assertEqual([(e.name, e.struct, e.line) for e in entries], [("w", "w_ftor", 1), ("x", "x_ftor", 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,16 +7,24 @@
 # Questions? Contact Greg von Winckel (gvonwin@sandia.gov)
 
 
+import os
+import re
 import subprocess
 import pytest
 from pathlib import Path
 
-# Discover the project root by looking for the .git directory
-PROJECT_ROOT = Path(__file__).parent
-while not (PROJECT_ROOT / ".git").exists():
-    PROJECT_ROOT = PROJECT_ROOT.parent
-    if PROJECT_ROOT == PROJECT_ROOT.parent:
-        raise FileNotFoundError("Could not find project root directory")
+def _find_root():
+    """Discover the project root by looking for the .git directory."""
+    root = Path(__file__).parent
+    while not (root / ".git").exists():
+        root = root.parent
+        if root == root.parent:
+            raise FileNotFoundError("Could not find project root directory")
+    return root
+
+
+# conftest.py exports TINCUP_ROOT, so the directory walk only runs on a cold import
+PROJECT_ROOT = Path(os.environ.get("TINCUP_ROOT") or _find_root())
 
 # Directory containing the diagnostic test cases
 DIAGNOSTICS_DIR = PROJECT_ROOT / "tests" / "diagnostic_messages"
@@ -24,46 +32,127 @@ DIAGNOSTICS_DIR = PROJECT_ROOT / "tests" / "diagnostic_messages"
 # Find all C++ files in the diagnostics directory
 test_files = list(DIAGNOSTICS_DIR.glob("*.cpp"))
 
-@pytest.mark.parametrize("cpp_file", test_files, ids=[f.name for f in test_files])
-def test_diagnostic(cpp_file):
-    """
-    Compiles a C++ file that is expected to fail and checks for a specific diagnostic message.
-    """
-    # The expected error is embedded in the C++ source file in a comment block.
-    # Example: /* expected_error: some error text */
-    expected_error = ""
-    with open(cpp_file, "r") as f:
-        content = f.read()
-        marker = "/* expected_error:";
-        if marker in content:
-            start = content.find(marker) + len(marker)
-            end = content.find("*/", start)
-            expected_error = content[start:end].strip()
+# The expected error is embedded in the C++ source file in a comment block.
+# Example: /* expected_error: some error text */
+_EXPECTED_ERROR = re.compile(rb"/\* expected_error:(.*?)\*/", re.S)
 
-    assert expected_error, f"No expected_error comment found in {cpp_file}"
 
-    print(f"\n  Testing: {cpp_file.name}\n  Expecting error: \"{expected_error}\"")
+def _extract_expected(cpp_file):
+    """Return the expected_error text of a diagnostic case, or "" if it has none."""
+    match = _EXPECTED_ERROR.search(cpp_file.read_bytes())
+    return match.group(1).strip().decode("utf-8") if match else ""
+
 
-    # Compile the C++ file and capture the output
+# (file, expected error) pairs, read once at collection time
+CASES = [(f, _extract_expected(f)) for f in test_files]
+
+# Lines that open a new diagnostic block in g++ output
+# ("In file included from ..." or "<file>: In instantiation of/function ...")
+_BLOCK_HEAD = re.compile(rb"In file included from |\S.*: In ")
+# Include-stack context lines, which belong to the block after them
+_INCLUDE_CONTEXT = re.compile(rb"In file included from |\s+from ")
+
+
+def _compile(cxx, tincup_pch, files):
+    """Syntax-check files in one g++ run and return its stderr as undecoded bytes."""
     # We pass an absolute path to the include directory to ensure it's found
     # regardless of where pytest is run.
+    # -include pulls in the precompiled tincup header (see conftest.py) ahead of each file.
     # -fsyntax-only is used to check for errors without generating a full build, which is faster.
+    # -pipe avoids temporary files and -w drops warnings we never look at, which
+    # keeps stderr small; errors are unaffected.
     command = [
-        "g++",
+        *cxx,
         "-std=c++20",
+        "-pipe",
+        "-w",
         f"-I{PROJECT_ROOT}",
+        "-include",
+        str(tincup_pch),
         "-fsyntax-only",
-        str(cpp_file),
+        *map(str, files),
     ]
-    
-    result = subprocess.run(command, capture_output=True, text=True)
+    # stderr stays bytes: the tests only do substring checks on it
+    return subprocess.run(command, capture_output=True).stderr
+
+
+def _split_blocks(stderr):
+    """Split g++ stderr into diagnostic blocks, each a list of lines."""
+    blocks = []
+    block = []
+    block_has_body = False
+    for line in stderr.splitlines(keepends=True):
+        # "In file included from" lines lead into the block that follows them
+        if _BLOCK_HEAD.match(line) and block_has_body:
+            blocks.append(block)
+            block = []
+            block_has_body = False
+        block.append(line)
+        if not _INCLUDE_CONTEXT.match(line):
+            block_has_body = True
+    if block:
+        blocks.append(block)
+    return blocks
+
+
+@pytest.fixture(scope="session")
+def diagnostics_by_file(cxx, tincup_pch):
+    """
+    Compiles every diagnostic C++ file in a single g++ run and returns each file's
+    share of stderr (as undecoded bytes), keyed by file name.
+    """
+    if not test_files:
+        return {}
+    # One compiler start-up and option parse for all cases instead of one per file
+    stderr = _compile(cxx, tincup_pch, test_files)
+
+    # g++ handles the inputs in order, so each file's diagnostics are a run of
+    # blocks. A block is owned by the case file whose "<file>:" location starts
+    # one of its lines (possibly as include context), and blocks without such a
+    # location belong to the last owner.
+    names = [bytes(f) for f in test_files]
+    index = {name: i for i, name in enumerate(names)}
+    owner_re = re.compile(
+        rb"(?:In file included from |\s+from )?(" + b"|".join(map(re.escape, names)) + rb"):"
+    )
+    slices = {}
+    current = -1
+    for block in _split_blocks(stderr):
+        owners = {index[m.group(1)] for m in map(owner_re.match, block) if m}
+        if len(owners) > 1 or (owners and min(owners) < current):
+            # The run cannot be attributed reliably; check every case on its own
+            slices = {}
+            break
+        if owners:
+            current = owners.pop()
+        if current >= 0:
+            name = test_files[current].name
+            slices[name] = slices.get(name, b"") + b"".join(block)
+
+    # Cases with nothing attributed to them are recompiled alone
+    for f in test_files:
+        if f.name not in slices:
+            slices[f.name] = _compile(cxx, tincup_pch, [f])
+    return slices
+
+
+@pytest.mark.parametrize("cpp_file,expected_error", CASES, ids=[f.name for f, _ in CASES])
+def test_diagnostic(cpp_file, expected_error, diagnostics_by_file):
+    """
+    Checks that a C++ file expected to fail to compile produces a specific diagnostic message.
+    """
+    assert expected_error, f"No expected_error comment found in {cpp_file}"
+
+    print(f"\n  Testing: {cpp_file.name}\n  Expecting error: \"{expected_error}\"")
+
+    stderr_output = diagnostics_by_file.get(cpp_file.name, b"")
 
     # Check that compilation failed
-    assert result.returncode != 0, f"Compilation of {cpp_file.name} succeeded but was expected to fail."
+    assert b"error:" in stderr_output, f"Compilation of {cpp_file.name} succeeded but was expected to fail."
 
-    # Check that the specific diagnostic message is present in stderr
-    stderr_output = result.stderr
-    assert expected_error in stderr_output, \
+    # Check that the specific diagnostic message is present in this file's stderr;
+    # only decode it to build the failure message
+    assert expected_error.encode("utf-8") in stderr_output, \
         f"Expected error message not found in compiler output for {cpp_file.name}.\n" \
         f"Expected: '{expected_error}'\n" \
-        f"Got: '{stderr_output}'"
+        f"Got: '{stderr_output.decode('utf-8', errors='replace')}'"